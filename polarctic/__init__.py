@@ -7,6 +7,36 @@ As of the Change Date specified in that file, in accordance with the Business So
 License, use of this software will be governed by the Apache License, version 2.0.
 """
 
+from polarctic.polarctic import AsyncCollector as AsyncCollector
+from polarctic.polarctic import DiskResultCache as DiskResultCache
+from polarctic.polarctic import LibraryPool as LibraryPool
+from polarctic.polarctic import MemoryResultCache as MemoryResultCache
+from polarctic.polarctic import ResultCache as ResultCache
+from polarctic.polarctic import ScanSpec as ScanSpec
+from polarctic.polarctic import SchemaCache as SchemaCache
+from polarctic.polarctic import async_collector as async_collector
+from polarctic.polarctic import collect_arcticdb_async as collect_arcticdb_async
+from polarctic.polarctic import count_arcticdb as count_arcticdb
+from polarctic.polarctic import index_range_arcticdb as index_range_arcticdb
+from polarctic.polarctic import library_pool as library_pool
 from polarctic.polarctic import scan_arcticdb as scan_arcticdb
+from polarctic.polarctic import scan_arcticdb_many as scan_arcticdb_many
+from polarctic.polarctic import schema_cache as schema_cache
 
-__all__ = ["scan_arcticdb"]
+__all__ = [
+    "AsyncCollector",
+    "DiskResultCache",
+    "LibraryPool",
+    "MemoryResultCache",
+    "ResultCache",
+    "ScanSpec",
+    "SchemaCache",
+    "async_collector",
+    "collect_arcticdb_async",
+    "count_arcticdb",
+    "index_range_arcticdb",
+    "library_pool",
+    "scan_arcticdb",
+    "scan_arcticdb_many",
+    "schema_cache",
+]
@@ -7,19 +7,44 @@ As of the Change Date specified in that file, in accordance with the Business So
 this software will be governed by the Apache License, version 2.0.
 """
 
+import abc
 import ast
+import asyncio
+import copy
 import datetime as dt
+import hashlib
+import json
+import multiprocessing
+import operator
+import os
+import pickle
 import re
-from collections.abc import Callable, Iterator
-from functools import lru_cache
-from typing import Any, cast, overload
+import tempfile
+import threading
+import time
+import weakref
+from collections import OrderedDict, deque
+from collections.abc import Callable, Generator, Iterator, Mapping, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import closing, suppress
+from functools import lru_cache, reduce
+from itertools import islice
+from pathlib import Path
+from typing import Any, Literal, NamedTuple, cast, get_args, overload
 
 import numpy as np
+import pandas as pd
 import polars as pl
 import pyarrow as pa
 from arcticdb import Arctic, LazyDataFrame, OutputFormat, QueryBuilder
-from arcticdb.version_store.library import Library, ReadRequest
-from arcticdb.version_store.processing import ExpressionNode
+from arcticdb.version_store.library import DataError, Library, ReadRequest
+from arcticdb.version_store.processing import (
+    ExpressionNode,
+    PythonDateRangeClause,
+    PythonFilterClause,
+    PythonProjectionClause,
+)
+from arcticdb_ext.types import DataType, TypeDescriptor
 from arcticdb_ext.util import RegexGeneric
 from arcticdb_ext.version_store import OperationType
 
@@ -49,6 +74,10 @@ class PolarsToArcticDBTranslator:
         Returns:
             Modified QueryBuilder instance
         """
+        return query_builder[self.to_expression_node(polars_expr)]
+
+    def to_expression_node(self, polars_expr: pl.Expr) -> Any:
+        """Build the ArcticDB ExpressionNode equivalent to a Polars expression."""
 
         # Clean the expression - remove surrounding brackets if present
         expr = str(polars_expr).strip()
@@ -62,12 +91,10 @@ class PolarsToArcticDBTranslator:
 
         # Parse the expression
         try:
-            expr_node = self._process_node(self._parse_expression(expr))
+            return self._process_node(self._parse_expression(expr))
         except SyntaxError as e:
             raise ValueError(f"Invalid Polars expression: {polars_expr}") from e
 
-        return query_builder[expr_node]
-
     def _replace_square_brackets(self, text: str) -> str:
         while True:
             close = text.rfind("])")
@@ -258,6 +285,181 @@ class PolarsToArcticDBTranslator:
         return None
 
 
+_TREE_BINARY_OPERATORS = {
+    "Eq": OperationType.EQ,
+    "NotEq": OperationType.NE,
+    "Lt": OperationType.LT,
+    "LtEq": OperationType.LE,
+    "Gt": OperationType.GT,
+    "GtEq": OperationType.GE,
+    "Plus": OperationType.ADD,
+    "Minus": OperationType.SUB,
+    "Multiply": OperationType.MUL,
+    "TrueDivide": OperationType.DIV,
+    # As in the string engine, AND/OR/XOR cover both boolean and bitwise expressions.
+    "And": OperationType.AND,
+    "Or": OperationType.OR,
+    "Xor": OperationType.XOR,
+    "LogicalAnd": OperationType.AND,
+    "LogicalOr": OperationType.OR,
+}
+
+_TREE_UNARY_FUNCTIONS = {
+    "Negate": OperationType.NEG,
+    "Abs": OperationType.ABS,
+    "Not": OperationType.NOT,
+    "IsNull": OperationType.ISNULL,
+    "IsNotNull": OperationType.NOTNULL,
+}
+
+_TREE_TIME_UNITS = {"Nanoseconds": "ns", "Microseconds": "us", "Milliseconds": "ms"}
+
+
+class PolarsExprTreeTranslator:
+    """
+    Translates Polars expressions to ArcticDB QueryBuilder operations by walking
+    the serialized expression tree, without going through str() and ast.
+
+    Usage:
+        translator = PolarsExprTreeTranslator()
+        qb = translator.translate(polars_expr, query_builder)
+    """
+
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _parse_tree(serialized: str) -> Any:
+        return json.loads(serialized)
+
+    def translate(self, polars_expr: pl.Expr, query_builder: Any) -> Any:
+        """
+        Translate a Polars expression to ArcticDB QueryBuilder operations.
+
+        Args:
+            polars_expr: Polars expression
+            query_builder: ArcticDB QueryBuilder instance
+
+        Returns:
+            Modified QueryBuilder instance
+        """
+        return query_builder[self.to_expression_node(polars_expr)]
+
+    def to_expression_node(self, polars_expr: pl.Expr) -> Any:
+        """Build the ArcticDB ExpressionNode equivalent to a Polars expression."""
+        try:
+            serialized = polars_expr.meta.serialize(format="json")
+        except (AttributeError, TypeError, pl.exceptions.PolarsError) as e:
+            raise ValueError(f"Invalid Polars expression: {polars_expr}") from e
+        return self._process_node(self._parse_tree(serialized))
+
+    def _process_node(self, node: Any) -> Any:
+        """Process a serialized expression node."""
+        if not isinstance(node, dict) or len(node) != 1:
+            raise NotImplementedError(f"Node {node!r} not supported")
+
+        ((kind, payload),) = node.items()
+        match kind:
+            case "Column":
+                return ExpressionNode.column_ref(payload)
+            case "Literal":
+                return self._process_literal(payload)
+            case "BinaryExpr":
+                return self._process_binary(payload)
+            case "Function":
+                return self._process_function(payload)
+            case _:
+                raise NotImplementedError(f"Node type {kind} not supported")
+
+    def _process_literal(self, payload: Any) -> Any:
+        """Process literal values (dynamic literals, typed scalars and series)."""
+        ((kind, value),) = payload.items()
+        match kind:
+            case "Dyn":
+                ((_dtype, dyn_value),) = value.items()
+                return dyn_value
+            case "Scalar":
+                ((dtype, scalar),) = value.items()
+                match dtype:
+                    case "Datetime":
+                        ticks, unit, tz = scalar
+                        if unit not in _TREE_TIME_UNITS:
+                            raise NotImplementedError(f"Time unit {unit} not supported")
+                        # Ticks are relative to the UTC epoch whatever the time zone.
+                        return pd.Timestamp(
+                            ticks, unit=_TREE_TIME_UNITS[unit], tz="UTC" if tz else None
+                        )
+                    case "Date":
+                        return dt.date(1970, 1, 1) + dt.timedelta(days=scalar)
+                    case "List":
+                        return self._decode_series(scalar)
+                    case "Null":
+                        raise NotImplementedError("Null literals not supported")
+                if isinstance(scalar, bool | int | float | str):
+                    return scalar
+                raise NotImplementedError(f"Literal of type {dtype} not supported")
+            case "Series":
+                return self._decode_series(value)
+            case _:
+                raise NotImplementedError(f"Literal {kind} not supported")
+
+    @staticmethod
+    def _decode_series(payload: list[int]) -> list[Any]:
+        """Decode a series literal, which Polars serializes as an Arrow IPC stream."""
+        return list(PolarsExprTreeTranslator._decode_ipc_stream(bytes(payload)))
+
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _decode_ipc_stream(payload: bytes) -> tuple[Any, ...]:
+        return tuple(pa.ipc.open_stream(payload).read_all().column(0).to_pylist())
+
+    def _process_binary(self, payload: Any) -> Any:
+        """Process binary operations and comparisons."""
+        op = payload["op"]
+        if op not in _TREE_BINARY_OPERATORS:
+            raise NotImplementedError(f"Operator {op} not supported")
+        left = self._process_node(payload["left"])
+        right = self._process_node(payload["right"])
+        return ExpressionNode.compose(left, _TREE_BINARY_OPERATORS[op], right)
+
+    def _process_function(self, payload: Any) -> Any:
+        """Process function nodes (e.g. abs(), is_null(), is_in(), str.contains())."""
+        function = payload["function"]
+        inputs = payload["input"]
+
+        if isinstance(function, str):
+            namespace, name = None, function
+        else:
+            ((namespace, name),) = function.items()
+
+        if isinstance(name, str):
+            if namespace not in (None, "Boolean") or name not in _TREE_UNARY_FUNCTIONS:
+                raise NotImplementedError(f"Function {name} not supported")
+            operand = self._process_node(inputs[0])
+            return ExpressionNode.compose(operand, _TREE_UNARY_FUNCTIONS[name], None)
+
+        ((method, options),) = name.items()
+        match namespace, method:
+            case "Boolean", "IsIn":
+                left = self._process_node(inputs[0])
+                values = self._process_node(inputs[1])
+                return ExpressionNode.compose(left, OperationType.ISIN, np.array(values))
+            case "StringExpr", "Contains":
+                left = self._process_node(inputs[0])
+                pattern = self._process_node(inputs[1])
+                if not isinstance(pattern, str):
+                    raise NotImplementedError("str.contains() requires a literal pattern")
+                if options.get("literal"):
+                    pattern = re.escape(pattern)
+                return ExpressionNode.compose(
+                    left, OperationType.REGEX_MATCH, RegexGeneric(pattern)
+                )
+            case _:
+                raise NotImplementedError(f"Function {namespace}.{method} not supported")
+
+
+TranslationEngine = Literal["string", "tree"]
+BatchAlignment = Literal["rows", "segments", "coalesce"]
+
+
 def parse_schema(
     lib: Library, symbol: str, as_of: int | str | dt.datetime | None = None
 ) -> pl.Schema:
@@ -269,242 +471,2677 @@ def parse_schema(
 
 
 _TRANSLATOR = PolarsToArcticDBTranslator()
+_TREE_TRANSLATOR = PolarsExprTreeTranslator()
 
 
-def _get_library_from_uri(uri: str, lib_name: str) -> Library:
-    return Arctic(uri).get_library(lib_name)
+def _get_translator(engine: TranslationEngine) -> Any:
+    match engine:
+        case "string":
+            return _TRANSLATOR
+        case "tree":
+            return _TREE_TRANSLATOR
+        case _:
+            raise ValueError(f"Unsupported translation engine: {engine}")
 
 
-def _translate_predicate(
-    predicate: pl.Expr | None,
-    query_builder: QueryBuilder | None = None,
-) -> QueryBuilder | None:
-    if predicate is None:
-        return query_builder
+class LibraryPool:
+    """
+    Process-wide cache of Arctic instances and Library handles for URI sources.
 
-    base_query_builder = query_builder or QueryBuilder()
-    try:
-        return cast(QueryBuilder, _TRANSLATOR.translate(predicate, base_query_builder))
-    except (NotImplementedError, ValueError):
-        # Unsupported predicate for ArcticDB pushdown; fall back to Polars-side filtering
-        return query_builder
+    Handles are keyed by URI and library name and evicted least-recently-used once
+    the pool holds more than ``max_arctics`` instances or ``max_libraries`` handles.
+    All methods are thread-safe. A forked child starts from an empty pool, as storage
+    connections must not be shared across processes.
 
+    Usage:
+        lib = library_pool.get_library(uri, lib_name)
+        library_pool.invalidate(uri)  # e.g. after the library was deleted
+    """
 
-def _iter_read_request_batches(
-    lib: Library,
-    read_request: ReadRequest,
-    n_rows: int | None,
-    batch_size: int | None,
-) -> Iterator[pl.DataFrame]:
-    # Fast path: Polars passes batch_size=None for a plain .collect() (no streaming).
-    # Execute a single lib.read() round-trip instead of looping with row_range slices.
-    if batch_size is None:
-        rr = read_request
-        if n_rows is not None:
-            base_start = 0
-            if rr.row_range is not None and rr.row_range[0] is not None:
-                base_start = rr.row_range[0]
-            end = base_start + n_rows
-            if rr.row_range is not None and rr.row_range[1] is not None:
-                end = min(end, rr.row_range[1])
-            rr = rr._replace(row_range=(base_start, end))
-        arrow_table = cast(pa.Table, lib.read(**rr._asdict()).data)
-        if arrow_table.num_rows > 0:
-            yield cast(pl.DataFrame, pl.from_arrow(arrow_table, rechunk=False))
-        return
+    def __init__(self, max_arctics: int = 8, max_libraries: int = 64) -> None:
+        if max_arctics < 1 or max_libraries < 1:
+            raise ValueError("LibraryPool sizes must be at least 1")
+        self.max_arctics = max_arctics
+        self.max_libraries = max_libraries
+        self._reset()
+        pool = weakref.ref(self)
+
+        def reset_in_child() -> None:
+            if (alive := pool()) is not None:
+                alive._reset()
+
+        os.register_at_fork(after_in_child=reset_in_child)
+
+    def _reset(self) -> None:
+        # A fresh lock too: another thread may have held the old one at fork time.
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._arctics: OrderedDict[str, Arctic] = OrderedDict()
+        self._libraries: OrderedDict[tuple[str, str], Library] = OrderedDict()
+        self._connect_locks: dict[str, threading.Lock] = {}
+
+    def get_library(self, uri: str, lib_name: str) -> Library:
+        """Return a pooled Library handle, connecting to the store on first use."""
+        with self._lock:
+            if self._pid != os.getpid():
+                self._reset_entries()
+            lib = self._cached_library(uri, lib_name)
+            if lib is not None:
+                return lib
+            connect_lock = self._connect_locks.setdefault(uri, threading.Lock())
+        # Connect outside the pool lock: it is a storage round trip. Lookups of the
+        # same store wait on its connect lock, so each store is opened only once.
+        with connect_lock:
+            with self._lock:
+                lib = self._cached_library(uri, lib_name)
+                if lib is not None:
+                    return lib
+                arctic = self._arctics.get(uri)
+            if arctic is None:
+                arctic = Arctic(uri)
+            lib = arctic.get_library(lib_name)
+            with self._lock:
+                if uri in self._arctics:
+                    self._arctics.move_to_end(uri)
+                else:
+                    self._arctics[uri] = arctic
+                    while len(self._arctics) > self.max_arctics:
+                        self._arctics.popitem(last=False)
+                self._libraries[(uri, lib_name)] = lib
+                while len(self._libraries) > self.max_libraries:
+                    self._libraries.popitem(last=False)
+            return lib
+
+    def _cached_library(self, uri: str, lib_name: str) -> Library | None:
+        lib = self._libraries.get((uri, lib_name))
+        if lib is not None:
+            self._libraries.move_to_end((uri, lib_name))
+        return lib
+
+    def invalidate(self, uri: str | None = None, lib_name: str | None = None) -> None:
+        """
+        Drop pooled handles so the next lookup reconnects.
 
-    # Streaming path: yield fixed-size batches so Polars can process them incrementally.
-    # ArcticDB LazyDataFrame.row_range mutates in place, so each batch must use a
-    # fresh ReadRequest with an absolute row_range.
-    effective_batch_size = batch_size
-    base_start = 0
-    base_end: int | None = None
-    if read_request.row_range is not None:
-        start, end = read_request.row_range
-        if start is not None:
-            base_start = start
-        if end is not None:
-            base_end = end
+        With no arguments the whole pool is cleared; with ``uri`` only handles for that
+        store are dropped, and with ``lib_name`` as well only that library's handle.
+        """
+        with self._lock:
+            if uri is None:
+                self._reset_entries()
+                return
+            if lib_name is None:
+                self._arctics.pop(uri, None)
+                for key in [key for key in self._libraries if key[0] == uri]:
+                    del self._libraries[key]
+            else:
+                self._libraries.pop((uri, lib_name), None)
 
-    read_offset = 0
-    remaining_rows = n_rows
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._libraries)
 
-    while remaining_rows is None or remaining_rows > 0:
-        current_batch_size = (
-            effective_batch_size
-            if remaining_rows is None
-            else min(effective_batch_size, remaining_rows)
-        )
+    def _reset_entries(self) -> None:
+        self._pid = os.getpid()
+        self._arctics.clear()
+        self._libraries.clear()
+        self._connect_locks.clear()
 
-        batch_start = base_start + read_offset
-        batch_end = batch_start + current_batch_size
-        if base_end is not None:
-            batch_end = min(batch_end, base_end)
-        if batch_end <= batch_start:
-            break
 
-        batch_request = read_request._replace(row_range=(batch_start, batch_end))
-        arrow_table = cast(pa.Table, lib.read(**batch_request._asdict()).data)
-        rows_read = arrow_table.num_rows
+library_pool = LibraryPool()
 
-        if rows_read == 0:
-            break
 
-        yield cast(pl.DataFrame, pl.from_arrow(arrow_table, rechunk=False))
+def _is_pinned_version(as_of: Any) -> bool:
+    """Whether as_of names one immutable version, rather than resolving at read time."""
+    return isinstance(as_of, int) and not isinstance(as_of, bool) and as_of >= 0
 
-        read_offset += rows_read
-        if remaining_rows is not None:
-            remaining_rows -= rows_read
-        if rows_read < current_batch_size:
-            break
 
+class SchemaCache:
+    """
+    Process-wide LRU cache of symbol schemas shared by all scans.
 
-def _register_arctic_source(
-    lib: Library,
-    schema_getter: Callable[[], pl.Schema],
-    read_request_getter: Callable[[], ReadRequest],
-) -> pl.LazyFrame:
-    # Cache the schema: Polars may call the getter repeatedly during lazy plan
-    # construction (after each .filter(), .select(), etc.).  The schema of a
-    # versioned symbol is immutable, so one call is always sufficient.
-    _cached_schema: pl.Schema | None = None
+    Entries are keyed by library identity, symbol and resolved version, and as the
+    schema of a version never changes they are kept until evicted. An ``as_of`` that
+    resolves at read time ("latest", negative versions, snapshots and timestamps) is
+    first resolved to a version number from the version metadata (no data IO). With
+    ``latest_ttl > 0`` that resolution is itself reused for ``latest_ttl`` seconds, so
+    a version written in the meantime is not seen until it expires.
 
-    def get_schema() -> pl.Schema:
-        nonlocal _cached_schema
-        if _cached_schema is None:
-            _cached_schema = schema_getter()
-        return _cached_schema
+    Usage:
+        schema = schema_cache.get(lib, symbol, as_of, loader)
+        schema_cache.invalidate()
+    """
 
-    _cached_read_request: ReadRequest | None = None
+    def __init__(self, maxsize: int = 256, latest_ttl: float = 0.0) -> None:
+        if maxsize < 1:
+            raise ValueError("SchemaCache maxsize must be at least 1")
+        if latest_ttl < 0:
+            raise ValueError("SchemaCache latest_ttl must not be negative")
+        self.maxsize = maxsize
+        self.latest_ttl = latest_ttl
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[Any, ...], pl.Schema] = OrderedDict()
+        self._versions: OrderedDict[tuple[Any, ...], tuple[int, float]] = OrderedDict()
+
+    def get(
+        self, lib: Library, symbol: str, as_of: Any, loader: Callable[[int], pl.Schema]
+    ) -> pl.Schema:
+        """Return the schema of the version as_of resolves to, loading it on a miss.
+
+        ``loader`` is called with the resolved version number.
+        """
+        symbol_key = (str(lib.arctic_instance_desc), lib.name, symbol)
+        version = self._resolve(lib, symbol_key, as_of)
+        key = (*symbol_key, version)
+        with self._lock:
+            schema = self._entries.get(key)
+            if schema is not None:
+                self._entries.move_to_end(key)
+                return schema
+        # Load outside the lock: it is a storage round trip.
+        schema = loader(version)
+        with self._lock:
+            self._entries[key] = schema
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return schema
+
+    def _resolve(self, lib: Library, symbol_key: tuple[str, str, str], as_of: Any) -> int:
+        if _is_pinned_version(as_of):
+            return cast(int, as_of)
+        key = (*symbol_key, as_of)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._versions.get(key)
+            if entry is not None and entry[1] > now:
+                return entry[0]
+        # Resolve outside the lock: it is a storage round trip.
+        version = _resolve_version(lib, symbol_key[2], as_of)
+        if self.latest_ttl > 0:
+            with self._lock:
+                self._versions[key] = (version, now + self.latest_ttl)
+                self._versions.move_to_end(key)
+                while len(self._versions) > self.maxsize:
+                    self._versions.popitem(last=False)
+        return version
+
+    def invalidate(self, lib: Library | None = None, symbol: str | None = None) -> None:
+        """Drop cached schemas, for one library (and symbol) or, by default, all of them."""
+        with self._lock:
+            if lib is None:
+                self._entries.clear()
+                self._versions.clear()
+                return
+            prefix = (str(lib.arctic_instance_desc), lib.name)
+            for entries in (self._entries, self._versions):
+                for key in list(entries):
+                    if key[:2] == prefix and (symbol is None or key[2] == symbol):
+                        del entries[key]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+schema_cache = SchemaCache()
+
+
+class ResultCache(abc.ABC):
+    """
+    Read-through cache of the Arrow tables returned by ``lib.read``.
 
-    def get_base_read_request() -> ReadRequest:
-        nonlocal _cached_read_request
-        if _cached_read_request is None:
-            base = read_request_getter()
-            if base.output_format != OutputFormat.PYARROW:
-                base = base._replace(output_format=OutputFormat.PYARROW)
-            _cached_read_request = base
-        return _cached_read_request
+    Pass an instance as ``scan_arcticdb(..., result_cache=...)``. Only reads of a
+    pinned version (``as_of`` a non-negative int, see ``pin_version``) are cached, keyed
+    by ``_result_cache_key``. Subclasses implement ``get`` and ``put``.
+    """
 
-    def source_generator(
-        with_columns: list[str] | None,
-        predicate: pl.Expr | None,
-        n_rows: int | None,
-        batch_size: int | None,
-    ) -> Iterator[pl.DataFrame]:
-        read_request = get_base_read_request()
+    @abc.abstractmethod
+    def get(self, key: str) -> pa.Table | None:
+        """Return the cached table for key, or None on a miss."""
 
-        if with_columns is not None:
-            read_request = read_request._replace(columns=with_columns)
+    @abc.abstractmethod
+    def put(self, key: str, table: pa.Table) -> None:
+        """Store table under key."""
 
-        translated_predicate = _translate_predicate(predicate, read_request.query_builder)
-        if translated_predicate is not read_request.query_builder:
-            read_request = read_request._replace(query_builder=translated_predicate)
 
-        yield from _iter_read_request_batches(lib, read_request, n_rows, batch_size)
+class MemoryResultCache(ResultCache):
+    """
+    In-process result cache bounded by the Arrow buffer bytes of the tables it holds.
 
-    return pl.io.plugins.register_io_source(  # type: ignore[attr-defined]
-        io_source=source_generator,
-        schema=get_schema,
-    )
+    Hits return the cached table itself, sharing its buffers. ``hits`` and ``misses``
+    count lookups since creation or the last ``clear()``.
 
+    Usage:
+        cache = MemoryResultCache(max_bytes=256 * 2**20)
+        lf = scan_arcticdb(lib, symbol, pin_version=True, result_cache=cache)
+    """
 
-def _scan_lazy_dataframe(source: LazyDataFrame) -> pl.LazyFrame:
-    """Register a Polars IO source backed by an existing ArcticDB LazyDataFrame.
+    def __init__(self, max_bytes: int = 2**28) -> None:
+        if max_bytes < 1:
+            raise ValueError("MemoryResultCache max_bytes must be at least 1")
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[pa.Table, int]] = OrderedDict()
+        self._total_bytes = 0
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, key: str) -> pa.Table | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: str, table: pa.Table) -> None:
+        size = table.get_total_buffer_size()
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._total_bytes -= previous[1]
+            self._entries[key] = (table, size)
+            self._total_bytes += size
+            while self._total_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._total_bytes -= evicted_size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+
+class DiskResultCache(ResultCache):
+    """
+    Result cache storing Arrow IPC files in a directory, evicted LRU by total bytes.
 
-    The LazyDataFrame may already carry ArcticDB-level QueryBuilder operations
-    (projections, filters). Any additional Polars predicates or
-    column selections are pushed down on top of those.
+    Hits are memory-mapped, so the returned table references the file without copying.
+    Several processes may share the directory: files are written atomically and the
+    recency of each entry is its modification time.
+
+    Usage:
+        cache = DiskResultCache("/var/cache/polarctic", max_bytes=10 * 2**30)
+        lf = scan_arcticdb(lib, symbol, pin_version=True, result_cache=cache)
     """
 
-    return _register_arctic_source(
-        lib=cast(Library, source.lib),
-        schema_getter=lambda: cast(pl.Schema, source._collect_schema()),  # type: ignore[attr-defined]
-        read_request_getter=lambda: cast(ReadRequest, source._to_read_request()),  # type: ignore[attr-defined]
+    _SUFFIX = ".arrow"
+
+    def __init__(self, directory: str | os.PathLike[str], max_bytes: int = 2**30) -> None:
+        if max_bytes < 1:
+            raise ValueError("DiskResultCache max_bytes must be at least 1")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        files = sorted(self.directory.glob(f"*{self._SUFFIX}"), key=lambda f: f.stat().st_mtime)
+        for file in files:
+            self._entries[file.stem] = file.stat().st_size
+        self._total_bytes = sum(self._entries.values())
+        self._evict()
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{self._SUFFIX}"
+
+    def get(self, key: str) -> pa.Table | None:
+        path = self._path(key)
+        try:
+            table = pa.ipc.open_file(pa.memory_map(str(path), "r")).read_all()
+            os.utime(path)
+        except (FileNotFoundError, pa.ArrowInvalid):
+            with self._lock:
+                self._discard(key)
+            return None
+        with self._lock:
+            if key not in self._entries:
+                # Written by another process sharing the directory.
+                self._add(key, path.stat().st_size)
+            self._entries.move_to_end(key)
+        return table
+
+    def put(self, key: str, table: pa.Table) -> None:
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with pa.OSFile(str(tmp_path), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        size = tmp_path.stat().st_size
+        if size > self.max_bytes:
+            tmp_path.unlink()
+            return
+        os.replace(tmp_path, path)
+        with self._lock:
+            self._discard(key)
+            self._add(key, size)
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+
+    def _add(self, key: str, size: int) -> None:
+        self._entries[key] = size
+        self._total_bytes += size
+
+    def _discard(self, key: str) -> None:
+        self._total_bytes -= self._entries.pop(key, 0)
+
+    def _remove(self, key: str) -> None:
+        self._discard(key)
+        # Tables still referencing a memory-mapped file keep its data alive.
+        with suppress(OSError):
+            self._path(key).unlink()
+
+    def _evict(self) -> None:
+        while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+            self._remove(next(iter(self._entries)))
+
+
+def _resolve_version(lib: Library, symbol: str, as_of: int | str | dt.datetime | None) -> int:
+    """Resolve as_of to a concrete version number from the version metadata (no data IO)."""
+    return int(lib.read_metadata(symbol, as_of=as_of).version)
+
+
+def _load_symbol_schema(lib: Library, symbol: str, as_of: Any) -> pl.Schema:
+    """Read the symbol's schema from its metadata (no data IO)."""
+    read_request = ReadRequest(symbol, as_of=as_of, output_format=OutputFormat.PYARROW)
+    return cast(pl.Schema, LazyDataFrame(lib, read_request)._collect_schema())  # type: ignore[attr-defined]
+
+
+def _pin_read_request(lib: Library, read_request: ReadRequest) -> ReadRequest:
+    """Resolve the request's as_of to a version number, so that all its reads see one version."""
+    if _is_pinned_version(read_request.as_of):
+        return read_request
+    return read_request._replace(
+        as_of=_resolve_version(lib, read_request.symbol, read_request.as_of)
     )
 
 
-@overload
-def scan_arcticdb(
-    source: str,
-    lib_name: str,
-    symbol: str,
-    /,
-    *,
-    as_of: int | str | dt.datetime | None = None,
-) -> pl.LazyFrame: ...
+def _get_library_from_uri(uri: str, lib_name: str) -> Library:
+    return library_pool.get_library(uri, lib_name)
 
 
-@overload
-def scan_arcticdb(
-    source: Library,
-    symbol: str,
-    /,
-    *,
-    as_of: int | str | dt.datetime | None = None,
-) -> pl.LazyFrame: ...
+def _resolve_library(
+    source: Any, lib_name_or_symbol: str | None, symbol: str | None
+) -> tuple[Library, str]:
+    """Resolve the URI and Library calling forms to a library and symbol."""
+    if isinstance(source, str):
+        if lib_name_or_symbol is None or symbol is None:
+            raise ValueError("lib_name and symbol are required when source is a URI string")
+        return _get_library_from_uri(source, lib_name_or_symbol), symbol
+    if isinstance(source, Library):
+        if lib_name_or_symbol is None:
+            raise ValueError("symbol is required when source is a Library")
+        return source, lib_name_or_symbol
+    raise TypeError(f"Unsupported source type: {type(source).__name__}")
 
 
-@overload
-def scan_arcticdb(
-    source: LazyDataFrame,
-    /,
-) -> pl.LazyFrame: ...
+_CONJUNCTION_OPERATORS = ("And", "LogicalAnd")
 
 
-def scan_arcticdb(
-    source: str | Library | LazyDataFrame,
-    lib_name_or_symbol: str | None = None,
-    symbol: str | None = None,
-    /,
-    *,
-    as_of: int | str | dt.datetime | None = None,
-) -> pl.LazyFrame:
+def _split_conjuncts(predicate: pl.Expr) -> list[pl.Expr]:
+    """Split a predicate into its top-level AND conjuncts, in their original order."""
+    try:
+        tree = PolarsExprTreeTranslator._parse_tree(predicate.meta.serialize(format="json"))
+    except (AttributeError, TypeError, pl.exceptions.PolarsError):
+        return [predicate]
+
+    def split(expr: pl.Expr, node: Any) -> list[pl.Expr]:
+        binary = node.get("BinaryExpr") if isinstance(node, dict) else None
+        if binary is None or binary["op"] not in _CONJUNCTION_OPERATORS:
+            return [expr]
+        # meta.pop() returns the inputs of the root node in reverse order.
+        right, left = expr.meta.pop()
+        return split(left, binary["left"]) + split(right, binary["right"])
+
+    return split(predicate, tree)
+
+
+def _push_conjuncts(
+    conjuncts: list[pl.Expr],
+    query_builder: QueryBuilder | None = None,
+    engine: TranslationEngine = "string",
+) -> tuple[QueryBuilder | None, pl.Expr | None]:
     """
-    Create a Polars LazyFrame backed by an ArcticDB symbol.
+    Push every translatable conjunct into the QueryBuilder.
 
-    Three calling forms are supported:
+    Returns the QueryBuilder (unchanged if nothing could be pushed down) and the
+    residual predicate that Polars must still apply, or None if everything was pushed.
+    """
+    translator = _get_translator(engine)
+    residual: list[pl.Expr] = []
+    for conjunct in conjuncts:
+        try:
+            query_builder = cast(
+                QueryBuilder, translator.translate(conjunct, query_builder or QueryBuilder())
+            )
+        except (NotImplementedError, ValueError):
+            # Unsupported conjunct for ArcticDB pushdown; fall back to Polars-side filtering
+            residual.append(conjunct)
 
-    1. URI form (highest overhead — opens an Arctic connection on each call)::
-           scan_arcticdb(uri, lib_name, symbol, *, as_of=None)
+    if not residual:
+        return query_builder, None
+    return query_builder, residual[0] if len(residual) == 1 else pl.all_horizontal(residual)
 
-    2. Library form (preferred for repeated calls against the same library)::
-           scan_arcticdb(lib, symbol, *, as_of=None)
 
-    3. LazyDataFrame form (pre-apply ArcticDB operations before Polars sees the data)::
-           scan_arcticdb(lazy_df)
+def _split_predicate(
+    predicate: pl.Expr | None,
+    query_builder: QueryBuilder | None = None,
+    engine: TranslationEngine = "string",
+) -> tuple[QueryBuilder | None, pl.Expr | None]:
+    if predicate is None:
+        return query_builder, None
+    return _push_conjuncts(_split_conjuncts(predicate), query_builder, engine)
+
+
+def _translate_predicate(
+    predicate: pl.Expr | None,
+    query_builder: QueryBuilder | None = None,
+    engine: TranslationEngine = "string",
+) -> QueryBuilder | None:
+    return _split_predicate(predicate, query_builder, engine)[0]
+
+
+# Polars aggregation nodes with an ArcticDB QueryBuilder.agg() equivalent.
+_AGGREGATIONS = {
+    "Sum": "sum",
+    "Mean": "mean",
+    "Min": "min",
+    "Max": "max",
+    "Count": "count",
+    "First": "first",
+    "Last": "last",
+}
+# ArcticDB only supports these in resample(), not in groupby().
+_RESAMPLE_ONLY_AGGREGATIONS = {"First", "Last"}
+
+
+def _translate_aggregations(
+    aggs: Sequence[pl.Expr], resample: bool = False
+) -> dict[str, tuple[str, str]]:
     """
-    if isinstance(source, str):
-        if lib_name_or_symbol is None or symbol is None:
-            raise ValueError("lib_name and symbol are required when source is a URI string")
-        lib = _get_library_from_uri(source, lib_name_or_symbol)
-    elif isinstance(source, Library):
-        lib = source
-        if lib_name_or_symbol is None:
-            raise ValueError("symbol is required when source is a Library")
-        symbol = lib_name_or_symbol
-    elif isinstance(source, LazyDataFrame):
-        return _scan_lazy_dataframe(source)
-    else:
-        raise TypeError(f"Unsupported source type: {type(source).__name__}")
+    Translate Polars aggregations such as ``pl.col("b").sum().alias("total")`` into a
+    QueryBuilder.agg() mapping of output column to (input column, aggregation).
 
-    base_lazy_source = cast(
-        LazyDataFrame,
-        lib.read(
-            symbol,
-            as_of=as_of,
-            lazy=True,
-            output_format=OutputFormat.PYARROW,
-        ),
-    )
+    first and last are only accepted for a resample.
+    """
+    aggregations: dict[str, tuple[str, str]] = {}
+    for expr in aggs:
+        node = PolarsExprTreeTranslator._parse_tree(expr.meta.serialize(format="json"))
+        output_name = None
+        if isinstance(node, dict) and "Alias" in node:
+            node, output_name = node["Alias"]
+        agg = node.get("Agg") if isinstance(node, dict) else None
+        if not isinstance(agg, dict) or len(agg) != 1:
+            raise ValueError(f"Cannot push down aggregation: {expr}")
+        ((kind, operand),) = agg.items()
+        if isinstance(operand, dict) and "input" in operand:
+            if operand.get("include_nulls"):
+                raise ValueError(f"Cannot push down aggregation: {expr}")
+            operand = operand["input"]
+        if kind not in _AGGREGATIONS or not isinstance(operand, dict) or "Column" not in operand:
+            raise ValueError(f"Cannot push down aggregation: {expr}")
+        if kind in _RESAMPLE_ONLY_AGGREGATIONS and not resample:
+            raise ValueError(f"Aggregation {kind.lower()} requires resample: {expr}")
+        column = operand["Column"]
+        output_name = output_name or column
+        if output_name in aggregations:
+            raise ValueError(f"Duplicate aggregation output column: {output_name}")
+        aggregations[output_name] = (column, _AGGREGATIONS[kind])
+    return aggregations
+
+
+def _apply_computed_columns(
+    lazy_df: LazyDataFrame,
+    computed: Sequence[pl.Expr],
+    engine: TranslationEngine,
+    existing_columns: Sequence[str],
+) -> LazyDataFrame:
+    """
+    Add each expression as a column computed by ArcticDB, named by its output name.
 
-    return _register_arctic_source(
-        lib=lib,
-        # _collect_schema() reads the schema from symbol metadata (no data IO),
-        # which is faster than parse_schema()'s row_range=(0,1) data read.
-        schema_getter=lambda: cast(pl.Schema, base_lazy_source._collect_schema()),  # type: ignore[attr-defined]
-        read_request_getter=lambda: cast(
-            ReadRequest,
-            base_lazy_source._to_read_request(),  # type: ignore[attr-defined]
-        ),
+    ArcticDB cannot overwrite a column, so output names must differ from the symbol's
+    columns and from each other.
+    """
+    translator = _get_translator(engine)
+    names = set(existing_columns)
+    for expr in computed:
+        name = expr.meta.output_name()
+        if name in names:
+            raise ValueError(f"Computed column name {name!r} clashes with an existing column")
+        names.add(name)
+        try:
+            expression_node = translator.to_expression_node(expr.meta.undo_aliases())
+        except (NotImplementedError, ValueError, TypeError, KeyError) as e:
+            raise ValueError(f"Cannot push down computed column: {expr}") from e
+        if not isinstance(expression_node, ExpressionNode):
+            raise ValueError(f"Cannot push down computed column: {expr}")
+        lazy_df = lazy_df.apply(name, expression_node)
+    return lazy_df
+
+
+_DURATION_UNITS = {"ns": "ns", "us": "us", "ms": "ms", "s": "s", "m": "min", "h": "h", "d": "D"}
+_DURATION_PART = re.compile(r"(\d+)(ns|us|ms|s|m|h|d)")
+
+
+def _duration_to_rule(every: str) -> str:
+    """Convert a fixed Polars duration such as ``"1m"`` or ``"1h30m"`` to a resample rule."""
+    parts = _DURATION_PART.findall(every)
+    if not parts or "".join(count + unit for count, unit in parts) != every:
+        raise ValueError(f"Cannot push down resample interval: {every}")
+    total = sum(
+        (pd.Timedelta(int(count), unit=_DURATION_UNITS[unit]) for count, unit in parts),
+        pd.Timedelta(0),
     )
+    if total <= pd.Timedelta(0):
+        raise ValueError(f"Cannot push down resample interval: {every}")
+    return cast(str, pd.tseries.frequencies.to_offset(total).freqstr)
+
+
+DateRange = tuple[pd.Timestamp | None, pd.Timestamp | None]
+
+# Comparison operators on the index column, as (bound, inclusive) with the column on the left.
+_INDEX_BOUND_OPERATORS = {
+    "GtEq": ("start", True),
+    "Gt": ("start", False),
+    "LtEq": ("end", True),
+    "Lt": ("end", False),
+}
+_FLIPPED_OPERATORS = {"GtEq": "LtEq", "Gt": "Lt", "LtEq": "GtEq", "Lt": "Gt", "Eq": "Eq"}
+_IS_BETWEEN_INCLUSIVITY = {
+    "Both": (True, True),
+    "Left": (True, False),
+    "Right": (False, True),
+    "None": (False, False),
+}
+
+
+def _get_index_column(lib: Library, symbol: str, as_of: Any) -> str | None:
+    """Name of the symbol's datetime index column in Arrow output, or None."""
+    return _description_index_column(lib.get_description(symbol, as_of=as_of))
+
+
+def _description_index_column(description: Any) -> str | None:
+    if description.index_type != "index" or len(description.index) != 1:
+        return None
+    index = description.index[0]
+    if not isinstance(index.dtype, TypeDescriptor):
+        return None
+    if index.dtype.data_type() != DataType.NANOSECONDS_UTC64:
+        return None
+    return cast(str, index.name) if index.name is not None else "__index__"
+
+
+def _index_literal(node: Any) -> pd.Timestamp | None:
+    if not isinstance(node, dict) or "Literal" not in node:
+        return None
+    try:
+        value = _TREE_TRANSLATOR._process_literal(node["Literal"])
+    except (NotImplementedError, ValueError):
+        return None
+    if not isinstance(value, dt.date):
+        return None
+    return pd.Timestamp(value)
+
+
+def _index_bounds(node: Any, index_column: str) -> list[tuple[str, pd.Timestamp, bool]] | None:
+    """
+    Extract (bound, timestamp, inclusive) bounds from a conjunct restricting the index.
+
+    Returns None if the conjunct is not a comparison of the index column with a
+    datetime literal.
+    """
+    column = {"Column": index_column}
+    if "BinaryExpr" in node:
+        binary = node["BinaryExpr"]
+        op, left, right = binary["op"], binary["left"], binary["right"]
+        if right == column:
+            op, left, right = _FLIPPED_OPERATORS.get(op), right, left
+        value = _index_literal(right)
+        if left != column or value is None:
+            return None
+        if op == "Eq":
+            return [("start", value, True), ("end", value, True)]
+        if op not in _INDEX_BOUND_OPERATORS:
+            return None
+        bound, inclusive = _INDEX_BOUND_OPERATORS[op]
+        return [(bound, value, inclusive)]
+
+    if "Function" in node:
+        function = node["Function"]
+        options = function["function"]
+        if not isinstance(options, dict) or not isinstance(options.get("Boolean"), dict):
+            return None
+        is_between = options["Boolean"].get("IsBetween")
+        inputs = function["input"]
+        if is_between is None or len(inputs) != 3 or inputs[0] != column:
+            return None
+        lower, upper = _index_literal(inputs[1]), _index_literal(inputs[2])
+        if lower is None or upper is None:
+            return None
+        lower_inclusive, upper_inclusive = _IS_BETWEEN_INCLUSIVITY[is_between["closed"]]
+        return [("start", lower, lower_inclusive), ("end", upper, upper_inclusive)]
+
+    return None
+
+
+def _extract_index_date_range(
+    conjuncts: list[pl.Expr], index_column: str
+) -> tuple[DateRange | None, list[pl.Expr]]:
+    """
+    Turn conjuncts restricting the datetime index into an inclusive date range.
+
+    Conjuncts fully expressed by the date range are dropped. Strict inequalities
+    still narrow the date range (so ArcticDB only fetches matching segments) but are
+    kept, since date_range bounds are always inclusive.
+    """
+    start: pd.Timestamp | None = None
+    end: pd.Timestamp | None = None
+    remaining: list[pl.Expr] = []
+    for conjunct in conjuncts:
+        try:
+            tree = PolarsExprTreeTranslator._parse_tree(conjunct.meta.serialize(format="json"))
+        except (AttributeError, TypeError, pl.exceptions.PolarsError):
+            tree = None
+        bounds = _index_bounds(tree, index_column) if isinstance(tree, dict) else None
+        if bounds is None:
+            remaining.append(conjunct)
+            continue
+        for bound, value, _inclusive in bounds:
+            if bound == "start":
+                start = value if start is None else max(start, value)
+            else:
+                end = value if end is None else min(end, value)
+        if not all(inclusive for _bound, _value, inclusive in bounds):
+            remaining.append(conjunct)
+
+    if start is None and end is None:
+        return None, conjuncts
+    return (start, end), remaining
+
+
+def _intersect_date_ranges(base: DateRange | None, other: DateRange) -> DateRange:
+    if base is None:
+        return other
+    # Bounds may mix tz-aware and naive timestamps, so compare them as naive UTC.
+    starts = [_to_utc_naive(bound) for bound in (base[0], other[0]) if bound is not None]
+    ends = [_to_utc_naive(bound) for bound in (base[1], other[1]) if bound is not None]
+    return (max(starts) if starts else None, min(ends) if ends else None)
+
+
+def _date_range_hull(date_ranges: Sequence[DateRange]) -> DateRange:
+    """The smallest date range containing every given range, as naive UTC bounds."""
+    starts = [date_range[0] for date_range in date_ranges]
+    ends = [date_range[1] for date_range in date_ranges]
+    return (
+        None if None in starts else min(_to_utc_naive(start) for start in starts),
+        None if None in ends else max(_to_utc_naive(end) for end in ends),
+    )
+
+
+def _to_utc_naive(timestamp: pd.Timestamp) -> pd.Timestamp:
+    return timestamp.tz_convert(None) if timestamp.tzinfo is not None else timestamp
+
+
+def _read_segment_index(lib: Library, symbol: str, as_of: Any) -> pd.DataFrame:
+    """The symbol's index key, with one entry per row slice in row order (no data IO)."""
+    index = lib._nvs.read_index(symbol, as_of=as_of)
+    # Wide symbols are also sliced by column: keep one entry per row slice.
+    return index.drop_duplicates(subset=["start_row", "end_row"]).sort_values("start_row")
+
+
+def _segment_row_slices(lib: Library, read_request: ReadRequest) -> list[tuple[int, int]]:
+    """
+    Row slices of the symbol's data segments, read from the index key (no data IO).
+
+    Only segments overlapping the request's date range are returned, in row order.
+    """
+    index = _read_segment_index(lib, read_request.symbol, read_request.as_of)
+    overlapping = np.ones(len(index), dtype=bool)
+    if read_request.date_range is not None:
+        date_start, date_end = read_request.date_range
+        if date_start is not None:
+            segment_ends = pd.DatetimeIndex(index["end_index"])
+            overlapping &= segment_ends > _to_utc_naive(pd.Timestamp(date_start))
+        if date_end is not None:
+            segment_starts = pd.DatetimeIndex(index.index)
+            overlapping &= segment_starts <= _to_utc_naive(pd.Timestamp(date_end))
+    return list(
+        zip(
+            index["start_row"][overlapping].tolist(),
+            index["end_row"][overlapping].tolist(),
+            strict=True,
+        )
+    )
+
+
+def _date_range_as_query(read_request: ReadRequest) -> ReadRequest:
+    """
+    Move the request's date_range into a leading date_range clause of its query.
+
+    A ReadRequest cannot carry both date_range and row_range, so reads sliced by
+    row_range trim rows to the date range with the clause instead.
+    """
+    query_builder = QueryBuilder().date_range(read_request.date_range)
+    if read_request.query_builder is not None:
+        query_builder = query_builder.then(read_request.query_builder)
+    return read_request._replace(date_range=None, query_builder=query_builder)
+
+
+def _resolve_row_range(
+    row_range: tuple[int | None, int | None] | None, total_rows: int
+) -> tuple[int, int]:
+    """Absolute (start, end) rows of a possibly open-ended or negative row_range."""
+    start, end = row_range if row_range is not None else (None, None)
+    start = 0 if start is None else start + total_rows if start < 0 else start
+    end = total_rows if end is None else end + total_rows if end < 0 else end
+    return max(0, min(start, total_rows)), max(0, min(end, total_rows))
+
+
+def _clip_row_slices(
+    row_slices: list[tuple[int, int]], start: int, end: int
+) -> list[tuple[int, int]]:
+    return [
+        (max(slice_start, start), min(slice_end, end))
+        for slice_start, slice_end in row_slices
+        if slice_end > start and slice_start < end
+    ]
+
+
+def _coalesce_row_slices(row_slices: list[tuple[int, int]], max_rows: int) -> list[tuple[int, int]]:
+    """Merge consecutive row slices while the merged range spans at most max_rows rows."""
+    merged: list[tuple[int, int]] = []
+    for start, end in row_slices:
+        if merged and merged[-1][1] == start and end - merged[-1][0] <= max_rows:
+            merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _group_row_slices(row_slices: list[tuple[int, int]], n_groups: int) -> list[tuple[int, int]]:
+    """Group consecutive row slices into at most n_groups ranges of similar row counts."""
+    total_rows = sum(end - start for start, end in row_slices)
+    target_rows = -(-total_rows // n_groups)
+    groups: list[tuple[int, int]] = []
+    group_start: int | None = None
+    group_rows = 0
+    for start, end in row_slices:
+        if group_start is None:
+            group_start = start
+        group_rows += end - start
+        if group_rows >= target_rows:
+            groups.append((group_start, end))
+            group_start, group_rows = None, 0
+    if group_start is not None:
+        groups.append((group_start, row_slices[-1][1]))
+    return groups
+
+
+def _read_request_fingerprint(lib: Library, read_request: ReadRequest) -> str:
+    """
+    Canonical fingerprint of a read of a symbol in a library.
+
+    The QueryBuilder is hashed through its pickled clauses, which, unlike its string
+    form, include every literal value.
+    """
+    fields = read_request._replace(query_builder=None)._asdict()
+    parts = (str(lib.arctic_instance_desc), lib.name, repr(sorted(fields.items(), key=str)))
+    digest = hashlib.sha256(repr(parts).encode())
+    if read_request.query_builder is not None:
+        digest.update(pickle.dumps(read_request.query_builder, protocol=5))
+    return digest.hexdigest()
+
+
+def _result_cache_key(lib: Library, read_request: ReadRequest) -> str | None:
+    """Fingerprint of a read of a pinned version, or None when as_of is not pinned."""
+    if not _is_pinned_version(read_request.as_of):
+        return None
+    return _read_request_fingerprint(lib, read_request)
+
+
+class _SingleFlight:
+    """
+    Let concurrent identical reads wait on one in-flight lib.read().
+
+    Reads are keyed by their fingerprint. A read arriving while an identical one is in
+    flight shares its Arrow table, which is immutable, or its exception. A read of the
+    latest version that joins a flight therefore sees the version that flight read.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._flights: dict[str, Future[pa.Table]] = {}
+
+    def read(self, key: str, loader: Callable[[], pa.Table]) -> pa.Table:
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if flight is None:
+                flight = self._flights[key] = Future()
+        if not leader:
+            return flight.result()
+
+        try:
+            table = loader()
+        except BaseException as error:
+            flight.set_exception(error)
+            raise
+        else:
+            flight.set_result(table)
+            return table
+        finally:
+            with self._lock:
+                del self._flights[key]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._flights)
+
+
+_single_flight = _SingleFlight()
+
+
+def _read_table(
+    lib: Library, read_request: ReadRequest, result_cache: ResultCache | None = None
+) -> pa.Table:
+    """
+    Run lib.read() for an Arrow table, through result_cache when one is given.
+
+    Identical reads running concurrently in other threads share a single lib.read().
+    """
+    key = _read_request_fingerprint(lib, read_request)
+    cached = result_cache is not None and _is_pinned_version(read_request.as_of)
+    if cached and result_cache is not None:
+        table = result_cache.get(key)
+        if table is not None:
+            return table
+
+    def load() -> pa.Table:
+        table = cast(pa.Table, lib.read(**read_request._asdict()).data)
+        if cached and result_cache is not None:
+            result_cache.put(key, table)
+        return table
+
+    return _single_flight.read(key, load)
+
+
+def _plan_row_slices(
+    lib: Library, read_request: ReadRequest
+) -> tuple[list[tuple[int, int]], ReadRequest]:
+    """
+    Segment row slices covering the request, and the request to read each of them with.
+
+    The row_range clips the slices, and a date_range moves into the query so that it
+    still trims rows exactly once reads are made by row range.
+    """
+    row_slices = _segment_row_slices(lib, read_request)
+    if row_slices and read_request.row_range is not None:
+        start, end = _resolve_row_range(read_request.row_range, row_slices[-1][1])
+        row_slices = _clip_row_slices(row_slices, start, end)
+    if read_request.date_range is not None:
+        read_request = _date_range_as_query(read_request)
+    return row_slices, read_request
+
+
+def _iter_limited_batches(
+    lib: Library,
+    read_request: ReadRequest,
+    n_rows: int | None,
+    result_cache: ResultCache | None = None,
+) -> Iterator[pl.DataFrame]:
+    """
+    Read the query over growing runs of segments, stopping once n_rows rows matched.
+
+    The first read covers one segment and each following read twice as many, so a
+    selective limit costs a handful of reads rather than a scan of the whole symbol.
+    Batches are produced lazily, so a consumer applying its own limit stops the reads.
+    """
+    # The runs are planned from one version's index and must all be read from it.
+    row_slices, read_request = _plan_row_slices(lib, _pin_read_request(lib, read_request))
+    remaining_rows = n_rows
+    position = 0
+    run_length = 1
+    while position < len(row_slices) and (remaining_rows is None or remaining_rows > 0):
+        run = row_slices[position : position + run_length]
+        run_request = read_request._replace(row_range=(run[0][0], run[-1][1]))
+        arrow_table = _read_table(lib, run_request, result_cache)
+        if remaining_rows is not None:
+            arrow_table = arrow_table.slice(0, remaining_rows)
+            remaining_rows -= arrow_table.num_rows
+        if arrow_table.num_rows > 0:
+            yield cast(pl.DataFrame, pl.from_arrow(arrow_table, rechunk=False))
+        position += run_length
+        run_length *= 2
+
+
+def _iter_parallel_batches(
+    lib: Library,
+    read_request: ReadRequest,
+    read_threads: int,
+    result_cache: ResultCache | None = None,
+) -> Iterator[pl.DataFrame]:
+    """Read segment-aligned row ranges concurrently, yielding them in row order."""
+    # The row ranges are planned from one version's index and must all be read from it.
+    row_slices, read_request = _plan_row_slices(lib, _pin_read_request(lib, read_request))
+    if not row_slices:
+        return
+
+    def read(row_range: tuple[int, int]) -> pa.Table:
+        return _read_table(lib, read_request._replace(row_range=row_range), result_cache)
+
+    row_ranges = _group_row_slices(row_slices, read_threads)
+    with ThreadPoolExecutor(max_workers=len(row_ranges)) as executor:
+        for arrow_table in executor.map(read, row_ranges):
+            if arrow_table.num_rows > 0:
+                yield cast(pl.DataFrame, pl.from_arrow(arrow_table, rechunk=False))
+
+
+class _ShardPools:
+    """
+    Process pools reading shards for ``read_processes``, one per worker count.
+
+    Workers are spawned rather than forked, as forking a process running Polars and
+    ArcticDB threads is unsafe, and are kept for reuse so that each one opens its
+    libraries once through ``library_pool``. A forked child starts without pools, and
+    a pool broken by a worker dying abruptly is replaced on the next lookup.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._pools: dict[int, ProcessPoolExecutor] = {}
+
+    def get(self, max_workers: int) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pid != os.getpid():
+                self._pid = os.getpid()
+                self._pools = {}
+            pool = self._pools.get(max_workers)
+            if pool is not None and pool._broken:  # type: ignore[attr-defined]
+                pool.shutdown(wait=False, cancel_futures=True)
+                pool = None
+            if pool is None:
+                pool = ProcessPoolExecutor(
+                    max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+                )
+                self._pools[max_workers] = pool
+            return pool
+
+
+_shard_pools = _ShardPools()
+
+
+def _shard_directory() -> str:
+    """Directory for shard files: shared memory where available, else the temp directory."""
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        return "/dev/shm"
+    return tempfile.gettempdir()
+
+
+def _read_shard(uri: str, lib_name: str, read_request: ReadRequest, directory: str) -> str:
+    """Process pool worker: read one request and write it to an Arrow IPC file."""
+    table = _read_table(library_pool.get_library(uri, lib_name), read_request)
+    fd, path = tempfile.mkstemp(prefix="polarctic-", suffix=".arrow", dir=directory)
+    with os.fdopen(fd, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    return path
+
+
+def _remove_shard(future: Future[str]) -> None:
+    if not future.cancelled() and future.exception() is None:
+        with suppress(OSError):
+            os.unlink(future.result())
+
+
+def _read_shards(
+    uri: str, lib_name: str, read_requests: list[ReadRequest], processes: int
+) -> Iterator[pa.Table]:
+    """
+    Read requests in worker processes, yielding the tables in request order.
+
+    Each worker writes its table to an Arrow IPC file in shared memory, which is
+    memory-mapped so that the table references it without copying. The file is
+    unlinked straight away: the mapping keeps its data alive until the table is freed.
+    """
+    pool = _shard_pools.get(processes)
+    directory = _shard_directory()
+    futures = [
+        pool.submit(_read_shard, uri, lib_name, read_request, directory)
+        for read_request in read_requests
+    ]
+    try:
+        for future in futures:
+            path = future.result()
+            table = pa.ipc.open_file(pa.memory_map(path, "r")).read_all()
+            with suppress(OSError):
+                os.unlink(path)
+            yield table
+    finally:
+        # Drop the shards of an abandoned or failed scan, as and when they complete.
+        for future in futures:
+            future.cancel()
+            future.add_done_callback(_remove_shard)
+
+
+def _iter_process_batches(
+    uri: str, lib: Library, read_request: ReadRequest, read_processes: int
+) -> Iterator[pl.DataFrame]:
+    """Read segment-aligned row ranges in worker processes, yielding them in row order."""
+    # Every worker must read the version whose index the row ranges were planned from.
+    row_slices, read_request = _plan_row_slices(lib, _pin_read_request(lib, read_request))
+    if not row_slices:
+        return
+    read_requests = [
+        read_request._replace(row_range=row_range)
+        for row_range in _group_row_slices(row_slices, read_processes)
+    ]
+    for arrow_table in _read_shards(uri, lib.name, read_requests, read_processes):
+        if arrow_table.num_rows > 0:
+            yield cast(pl.DataFrame, pl.from_arrow(arrow_table, rechunk=False))
+
+
+def _with_head(query_builder: QueryBuilder | None, n_rows: int) -> QueryBuilder:
+    """Copy of the QueryBuilder keeping only the first n_rows rows of its output."""
+    limited = copy.deepcopy(query_builder) if query_builder is not None else QueryBuilder()
+    return cast(QueryBuilder, limited.head(n_rows))
+
+
+def _filter_batches(
+    batches: Iterator[pl.DataFrame],
+    predicate: pl.Expr,
+    n_rows: int | None,
+) -> Iterator[pl.DataFrame]:
+    """Apply a residual predicate to each batch, stopping once n_rows rows matched."""
+    remaining_rows = n_rows
+    for batch in batches:
+        filtered = batch.filter(predicate)
+        if remaining_rows is not None:
+            filtered = filtered.head(remaining_rows)
+            remaining_rows -= filtered.height
+        if filtered.height > 0:
+            yield filtered
+        if remaining_rows == 0:
+            return
+
+
+def _row_ranges(start: int, end: int, batch_size: int) -> Iterator[tuple[int, int]]:
+    for batch_start in range(start, end, batch_size):
+        yield batch_start, min(batch_start + batch_size, end)
+
+
+def _iter_prefetched(
+    read: Callable[[tuple[int, int]], pa.Table],
+    row_ranges: Iterator[tuple[int, int]],
+    depth: int,
+) -> Generator[pa.Table, None, None]:
+    """
+    Yield read(row_range) for each row range, keeping up to depth reads running ahead.
+
+    The queue of pending reads is bounded by depth, so a slow consumer stops further
+    reads from being issued. Closing the generator cancels the reads not yet started.
+    """
+    executor = ThreadPoolExecutor(max_workers=depth)
+    pending: deque[Future[pa.Table]] = deque(
+        executor.submit(read, row_range) for row_range in islice(row_ranges, depth)
+    )
+    try:
+        while pending:
+            future = pending.popleft()
+            next_range = next(row_ranges, None)
+            if next_range is not None:
+                pending.append(executor.submit(read, next_range))
+            yield future.result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _iter_row_range_batches(
+    lib: Library,
+    read_request: ReadRequest,
+    row_ranges: Iterator[tuple[int, int]],
+    n_rows: int | None,
+    prefetch: int,
+    result_cache: ResultCache | None = None,
+) -> Iterator[pl.DataFrame]:
+    """Read each planned row range in turn, stopping once n_rows rows were returned."""
+
+    def read(row_range: tuple[int, int]) -> pa.Table:
+        return _read_table(lib, read_request._replace(row_range=row_range), result_cache)
+
+    tables = (
+        _iter_prefetched(read, row_ranges, prefetch)
+        if prefetch > 0
+        else (read(row_range) for row_range in row_ranges)
+    )
+    remaining_rows = n_rows
+    with closing(tables) as arrow_tables:
+        for arrow_table in arrow_tables:
+            if remaining_rows is not None:
+                arrow_table = arrow_table.slice(0, remaining_rows)
+                remaining_rows -= arrow_table.num_rows
+            if arrow_table.num_rows > 0:
+                yield cast(pl.DataFrame, pl.from_arrow(arrow_table, rechunk=False))
+            if remaining_rows == 0:
+                return
+
+
+def _has_clauses(query_builder: QueryBuilder | None) -> bool:
+    return query_builder is not None and len(query_builder.clauses) > 0
+
+
+_ROW_WISE_CLAUSES = (PythonFilterClause, PythonProjectionClause, PythonDateRangeClause)
+
+
+def _is_row_wise(query_builder: QueryBuilder | None) -> bool:
+    """Whether the query can run independently on disjoint row ranges of the symbol."""
+    if query_builder is None:
+        return True
+    return all(
+        isinstance(clause, _ROW_WISE_CLAUSES)
+        for clause in query_builder._python_clauses  # type: ignore[attr-defined]
+    )
+
+
+def _iter_read_request_batches(
+    lib: Library,
+    read_request: ReadRequest,
+    n_rows: int | None,
+    batch_size: int | None,
+    read_threads: int = 1,
+    prefetch: int = 0,
+    batch_alignment: BatchAlignment = "rows",
+    result_cache: ResultCache | None = None,
+    read_processes: int = 1,
+    uri: str | None = None,
+) -> Iterator[pl.DataFrame]:
+    if read_request.row_range is not None and any(
+        bound is not None and bound < 0 for bound in read_request.row_range
+    ):
+        # Bounds counting from the end (e.g. a tail) are resolved against the row count
+        # once, so that every strategy below works with absolute row numbers.
+        total_rows = lib.get_description(read_request.symbol, as_of=read_request.as_of).row_count
+        read_request = read_request._replace(
+            row_range=_resolve_row_range(read_request.row_range, total_rows)
+        )
+
+    # Fast path: Polars passes batch_size=None for a plain .collect() (no streaming).
+    # Execute a single lib.read() round-trip instead of looping with row_range slices,
+    # or split it into segment-aligned row ranges read concurrently.
+    if batch_size is not None and not _is_row_wise(read_request.query_builder):
+        # Aggregating queries cannot run on row slices independently: read in one go.
+        batch_size = None
+
+    if batch_size is None and n_rows is None and _is_row_wise(read_request.query_builder):
+        if read_processes > 1 and uri is not None:
+            yield from _iter_process_batches(uri, lib, read_request, read_processes)
+            return
+        if read_threads > 1:
+            yield from _iter_parallel_batches(lib, read_request, read_threads, result_cache)
+            return
+
+    if batch_size is None:
+        rr = read_request
+        limited_query = n_rows is not None and (
+            rr.date_range is not None or _has_clauses(rr.query_builder)
+        )
+        if limited_query and _is_row_wise(rr.query_builder):
+            # A head() clause would still run the query over every segment: read growing
+            # runs of segments instead, until enough rows matched.
+            yield from _iter_limited_batches(lib, rr, n_rows, result_cache)
+            return
+        if limited_query and n_rows is not None:
+            # row_range is applied before the QueryBuilder and cannot be combined with
+            # date_range, so limit the output of the query instead.
+            rr = rr._replace(query_builder=_with_head(rr.query_builder, n_rows))
+        elif n_rows is not None:
+            base_start = 0
+            if rr.row_range is not None and rr.row_range[0] is not None:
+                base_start = rr.row_range[0]
+            end = base_start + n_rows
+            if rr.row_range is not None and rr.row_range[1] is not None:
+                end = min(end, rr.row_range[1])
+            rr = rr._replace(row_range=(base_start, end))
+        arrow_table = _read_table(lib, rr, result_cache)
+        if arrow_table.num_rows > 0:
+            yield cast(pl.DataFrame, pl.from_arrow(arrow_table, rechunk=False))
+        return
+
+    # Streaming path: yield fixed-size batches so Polars can process them incrementally.
+    # ArcticDB LazyDataFrame.row_range mutates in place, so each batch must use a
+    # fresh ReadRequest with an absolute row_range.
+    effective_batch_size = batch_size
+    base_start = 0
+    base_end: int | None = None
+    if read_request.row_range is not None:
+        start, end = read_request.row_range
+        if start is not None:
+            base_start = start
+        if end is not None:
+            base_end = end
+
+    row_slices: list[tuple[int, int]] = []
+    if read_request.date_range is not None or batch_alignment != "rows":
+        row_slices = _segment_row_slices(lib, read_request)
+
+    if read_request.date_range is not None:
+        # Restrict the row range to the segments overlapping the date range, and trim
+        # rows exactly with a date_range clause ahead of the rest of the query.
+        segment_start, segment_end = (row_slices[0][0], row_slices[-1][1]) if row_slices else (0, 0)
+        base_start = max(base_start, segment_start)
+        base_end = segment_end if base_end is None else min(base_end, segment_end)
+        read_request = _date_range_as_query(read_request)
+
+    # With a query, each row slice may return fewer rows than it spans, so slices
+    # advance by their span and the end of the symbol must be known up front.
+    filtered = _has_clauses(read_request.query_builder)
+
+    if batch_alignment != "rows":
+        # Snap batches to the segment layout so that every segment is decoded once.
+        if base_end is None:
+            base_end = row_slices[-1][1] if row_slices else 0
+        if n_rows is not None and not filtered:
+            base_end = min(base_end, base_start + n_rows)
+        row_slices = _clip_row_slices(row_slices, base_start, base_end)
+        if batch_alignment == "coalesce":
+            row_slices = _coalesce_row_slices(row_slices, effective_batch_size)
+        yield from _iter_row_range_batches(
+            lib, read_request, iter(row_slices), n_rows, prefetch, result_cache
+        )
+        return
+
+    if filtered and base_end is None:
+        base_end = lib.get_description(read_request.symbol, as_of=read_request.as_of).row_count
+
+    if prefetch > 0:
+        if base_end is None:
+            base_end = lib.get_description(read_request.symbol, as_of=read_request.as_of).row_count
+        if n_rows is not None and not filtered:
+            base_end = min(base_end, base_start + n_rows)
+        yield from _iter_row_range_batches(
+            lib,
+            read_request,
+            _row_ranges(base_start, base_end, batch_size),
+            n_rows,
+            prefetch,
+            result_cache,
+        )
+        return
+
+    read_offset = 0
+    remaining_rows = n_rows
+
+    while remaining_rows is None or remaining_rows > 0:
+        current_batch_size = (
+            effective_batch_size
+            if remaining_rows is None or filtered
+            else min(effective_batch_size, remaining_rows)
+        )
+
+        batch_start = base_start + read_offset
+        batch_end = batch_start + current_batch_size
+        if base_end is not None:
+            batch_end = min(batch_end, base_end)
+        if batch_end <= batch_start:
+            break
+
+        batch_request = read_request._replace(row_range=(batch_start, batch_end))
+        arrow_table = _read_table(lib, batch_request, result_cache)
+        rows_read = arrow_table.num_rows
+
+        if filtered:
+            read_offset = batch_end - base_start
+            if remaining_rows is not None and rows_read > remaining_rows:
+                arrow_table = arrow_table.slice(0, remaining_rows)
+                rows_read = remaining_rows
+            if rows_read > 0:
+                yield cast(pl.DataFrame, pl.from_arrow(arrow_table, rechunk=False))
+                if remaining_rows is not None:
+                    remaining_rows -= rows_read
+            continue
+
+        if rows_read == 0:
+            break
+
+        yield cast(pl.DataFrame, pl.from_arrow(arrow_table, rechunk=False))
+
+        read_offset += rows_read
+        if remaining_rows is not None:
+            remaining_rows -= rows_read
+        if rows_read < current_batch_size:
+            break
+
+
+def _weakest_pushed_query(
+    predicates: Sequence[pl.Expr | None], engine: TranslationEngine = "string"
+) -> QueryBuilder | None:
+    """
+    Build a query keeping every row that at least one of the predicates keeps.
+
+    Each predicate contributes the conjunction of its translatable conjuncts, which it
+    implies. The query is their disjunction, or None if some predicate pushes nothing.
+    """
+    translator = _get_translator(engine)
+    disjuncts = []
+    for predicate in predicates:
+        if predicate is None:
+            return None
+        nodes = []
+        for conjunct in _split_conjuncts(predicate):
+            with suppress(NotImplementedError, ValueError):
+                nodes.append(translator.to_expression_node(conjunct))
+        if not nodes:
+            return None
+        disjuncts.append(reduce(operator.and_, nodes))
+    return cast(QueryBuilder, QueryBuilder()[reduce(operator.or_, disjuncts)])
+
+
+class _CoalescedRead:
+    """A read shared by the scans of one symbol version that joined it in time."""
+
+    def __init__(self) -> None:
+        self.consumers: list[tuple[list[str] | None, pl.Expr | None, DateRange | None]] = []
+        self.done = threading.Event()
+        self.reading = False
+        self.table: pa.Table | None = None
+        self.error: BaseException | None = None
+
+
+class _ReadCoalescer:
+    """
+    Merge concurrent scans of the same symbol version into one lib.read().
+
+    The first scan of a (library, symbol, version, range) waits ``window`` seconds for
+    others to join, as the sources of a ``pl.collect_all()`` do, then reads the union
+    of their columns and index date ranges under the weakest common pushed predicate.
+    Each scan then applies its own projection and predicate to the shared table.
+
+    Once a scan read alone, the next scan of that key reads without waiting. The wait
+    resumes as soon as another scan of the key arrives during such a read.
+    """
+
+    max_solo_keys = 1024
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pending: dict[tuple[str, ...], _CoalescedRead] = {}
+        # Keys whose last read had a single scan, least recently used first.
+        self._solo_keys: OrderedDict[tuple[str, ...], None] = OrderedDict()
+
+    def read(
+        self,
+        lib: Library,
+        read_request: ReadRequest,
+        with_columns: list[str] | None,
+        predicate: pl.Expr | None,
+        window: float,
+        translation_engine: TranslationEngine = "string",
+        result_cache: ResultCache | None = None,
+        index_range: DateRange | None = None,
+    ) -> pa.Table:
+        """
+        Read the rows the scan needs, sharing the read with scans that join in time.
+
+        ``predicate`` is the part of the scan's predicate to push down and
+        ``index_range`` the date range its index predicates select, if any.
+        """
+        key = (
+            str(lib.arctic_instance_desc),
+            lib.name,
+            read_request.symbol,
+            repr(read_request.as_of),
+            repr(read_request.date_range),
+            repr(read_request.row_range),
+        )
+        with self._lock:
+            shared = self._pending.get(key)
+            if shared is not None and shared.reading:
+                # Too late to join, but the key is evidently scanned concurrently.
+                self._solo_keys.pop(key, None)
+                shared = None
+            leader = shared is None
+            if shared is None:
+                shared = self._pending[key] = _CoalescedRead()
+                wait = key not in self._solo_keys
+            shared.consumers.append((with_columns, predicate, index_range))
+
+        if not leader:
+            shared.done.wait()
+            if shared.error is not None:
+                raise shared.error
+            return cast(pa.Table, shared.table)
+
+        try:
+            try:
+                if wait:
+                    time.sleep(window)
+            finally:
+                with self._lock:
+                    shared.reading = True
+                    if len(shared.consumers) > 1:
+                        self._solo_keys.pop(key, None)
+                    else:
+                        self._solo_keys[key] = None
+                        self._solo_keys.move_to_end(key)
+                        while len(self._solo_keys) > self.max_solo_keys:
+                            self._solo_keys.popitem(last=False)
+            columns: list[str] | None = []
+            for consumer_columns, consumer_predicate, _ in shared.consumers:
+                if consumer_columns is None or columns is None:
+                    columns = None
+                    continue
+                needed = [*consumer_columns]
+                if consumer_predicate is not None:
+                    needed.extend(consumer_predicate.meta.root_names())
+                columns.extend(column for column in needed if column not in columns)
+            query_builder = _weakest_pushed_query(
+                [consumer_predicate for _, consumer_predicate, _ in shared.consumers],
+                translation_engine,
+            )
+            read_request = read_request._replace(columns=columns, query_builder=query_builder)
+            index_ranges = [consumer_range for _, _, consumer_range in shared.consumers]
+            if None not in index_ranges:
+                read_request = read_request._replace(
+                    date_range=_intersect_date_ranges(
+                        read_request.date_range,
+                        _date_range_hull(cast(list[DateRange], index_ranges)),
+                    )
+                )
+            shared.table = _read_table(lib, read_request, result_cache)
+        except BaseException as error:
+            shared.error = error
+            raise
+        finally:
+            with self._lock:
+                if self._pending.get(key) is shared:
+                    del self._pending[key]
+            shared.done.set()
+        return shared.table
+
+
+_read_coalescer = _ReadCoalescer()
+
+IOSource = Callable[
+    [list[str] | None, pl.Expr | None, int | None, int | None], Iterator[pl.DataFrame]
+]
+
+
+class ScanSpec(NamedTuple):
+    """
+    Picklable description of a URI-form ``scan_arcticdb`` source.
+
+    LazyFrames from the URI form of ``scan_arcticdb`` pickle their source as a
+    ScanSpec, with the version pinned at pickling time, so they can be sent to worker
+    processes. Workers rebuild the source from the spec, opening the library through
+    ``library_pool``, without re-running plan construction. A ``result_cache`` is not
+    carried over.
+
+    Usage:
+        spec = ScanSpec(uri, lib_name, ReadRequest(symbol, as_of=3, columns=["a"]))
+        df = spec.scan().collect()
+    """
+
+    uri: str
+    lib_name: str
+    read_request: ReadRequest
+    translation_engine: TranslationEngine = "string"
+    read_threads: int = 1
+    prefetch: int = 0
+    batch_alignment: BatchAlignment = "rows"
+    coalesce_window: float = 0.0
+    read_processes: int = 1
+
+    def scan(self) -> pl.LazyFrame:
+        """Create a Polars LazyFrame backed by the described source."""
+        io_source, schema = _spec_source_functions(self)
+        return pl.io.plugins.register_io_source(  # type: ignore[attr-defined]
+            io_source=io_source,
+            schema=schema,
+        )
+
+
+class _SpecBound:
+    """A source function that pickles as the ScanSpec it can be rebuilt from."""
+
+    def __init__(
+        self, function: Callable[..., Any], spec_getter: Callable[[], ScanSpec], is_schema: bool
+    ) -> None:
+        self._function = function
+        self._spec_getter = spec_getter
+        self._is_schema = is_schema
+
+    def __call__(self, *args: Any) -> Any:
+        return self._function(*args)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return _rebuild_spec_function, (self._spec_getter(), self._is_schema)
+
+
+def _pin_spec(spec: ScanSpec, lib: Library) -> ScanSpec:
+    read_request = spec.read_request
+    if _is_pinned_version(read_request.as_of):
+        return spec
+    as_of = _resolve_version(lib, read_request.symbol, read_request.as_of)
+    return spec._replace(read_request=read_request._replace(as_of=as_of))
+
+
+def _spec_source_functions(spec: ScanSpec) -> tuple[IOSource, Callable[[], pl.Schema]]:
+    lib = library_pool.get_library(spec.uri, spec.lib_name)
+    read_request = spec.read_request
+
+    def schema_getter() -> pl.Schema:
+        if read_request.columns is not None or _has_clauses(read_request.query_builder):
+            lazy_df = lib.read(
+                **read_request._replace(output_format=OutputFormat.PYARROW)._asdict(), lazy=True
+            )
+            return cast(pl.Schema, lazy_df._collect_schema())  # type: ignore[attr-defined]
+        return schema_cache.get(
+            lib,
+            read_request.symbol,
+            read_request.as_of,
+            lambda version: _load_symbol_schema(lib, read_request.symbol, version),
+        )
+
+    io_source, get_schema = _arctic_source_functions(
+        lib,
+        schema_getter,
+        lambda: read_request,
+        translation_engine=spec.translation_engine,
+        read_threads=spec.read_threads,
+        prefetch=spec.prefetch,
+        batch_alignment=spec.batch_alignment,
+        coalesce_window=spec.coalesce_window,
+        read_processes=spec.read_processes,
+        uri=spec.uri,
+    )
+
+    def get_spec() -> ScanSpec:
+        return _pin_spec(spec, lib)
+
+    return _SpecBound(io_source, get_spec, False), _SpecBound(get_schema, get_spec, True)
+
+
+def _rebuild_spec_function(spec: ScanSpec, is_schema: bool) -> Callable[..., Any]:
+    io_source, get_schema = _spec_source_functions(spec)
+    return get_schema if is_schema else io_source
+
+
+def _register_arctic_source(
+    lib: Library,
+    schema_getter: Callable[[], pl.Schema],
+    read_request_getter: Callable[[], ReadRequest],
+    translation_engine: TranslationEngine = "string",
+    read_threads: int = 1,
+    prefetch: int = 0,
+    batch_alignment: BatchAlignment = "rows",
+    result_cache: ResultCache | None = None,
+    coalesce_window: float = 0.0,
+    read_processes: int = 1,
+    uri: str | None = None,
+) -> pl.LazyFrame:
+    io_source, schema = _arctic_source_functions(
+        lib,
+        schema_getter,
+        read_request_getter,
+        translation_engine,
+        read_threads,
+        prefetch,
+        batch_alignment,
+        result_cache,
+        coalesce_window,
+        read_processes,
+        uri,
+    )
+    if uri is not None:
+        # Sources opened from a URI can be rebuilt in another process, which makes
+        # their LazyFrames picklable.
+        def get_spec() -> ScanSpec:
+            spec = ScanSpec(
+                uri,
+                lib.name,
+                read_request_getter(),
+                translation_engine,
+                read_threads,
+                prefetch,
+                batch_alignment,
+                coalesce_window,
+                read_processes,
+            )
+            return _pin_spec(spec, lib)
+
+        io_source = _SpecBound(io_source, get_spec, False)
+        schema = _SpecBound(schema, get_spec, True)
+
+    return pl.io.plugins.register_io_source(  # type: ignore[attr-defined]
+        io_source=io_source,
+        schema=schema,
+    )
+
+
+def _arctic_source_functions(
+    lib: Library,
+    schema_getter: Callable[[], pl.Schema],
+    read_request_getter: Callable[[], ReadRequest],
+    translation_engine: TranslationEngine = "string",
+    read_threads: int = 1,
+    prefetch: int = 0,
+    batch_alignment: BatchAlignment = "rows",
+    result_cache: ResultCache | None = None,
+    coalesce_window: float = 0.0,
+    read_processes: int = 1,
+    uri: str | None = None,
+) -> tuple[IOSource, Callable[[], pl.Schema]]:
+    """Build the IO source generator and schema getter of a symbol's scan."""
+    if read_threads < 1:
+        raise ValueError(f"read_threads must be at least 1, got {read_threads}")
+    if read_processes < 1:
+        raise ValueError(f"read_processes must be at least 1, got {read_processes}")
+    if prefetch < 0:
+        raise ValueError(f"prefetch must not be negative, got {prefetch}")
+    if batch_alignment not in get_args(BatchAlignment):
+        raise ValueError(f"Unsupported batch alignment: {batch_alignment}")
+    if coalesce_window < 0:
+        raise ValueError(f"coalesce_window must not be negative, got {coalesce_window}")
+    if coalesce_window > 0 and (
+        read_threads > 1 or read_processes > 1 or prefetch > 0 or batch_alignment != "rows"
+    ):
+        raise ValueError(
+            "coalesce_window cannot be combined with read_threads, read_processes, "
+            "prefetch or batch_alignment"
+        )
+
+    # Fail at plan construction rather than at collect() on an unknown engine name.
+    _get_translator(translation_engine)
+
+    # Cache the schema: Polars may call the getter repeatedly during lazy plan
+    # construction (after each .filter(), .select(), etc.).  The schema of a
+    # versioned symbol is immutable, so one call is always sufficient.
+    _cached_schema: pl.Schema | None = None
+
+    def get_schema() -> pl.Schema:
+        nonlocal _cached_schema
+        if _cached_schema is None:
+            _cached_schema = schema_getter()
+        return _cached_schema
+
+    _cached_read_request: ReadRequest | None = None
+
+    def get_base_read_request() -> ReadRequest:
+        nonlocal _cached_read_request
+        if _cached_read_request is None:
+            base = read_request_getter()
+            if base.output_format != OutputFormat.PYARROW:
+                base = base._replace(output_format=OutputFormat.PYARROW)
+            _cached_read_request = base
+        return _cached_read_request
+
+    _index_column_resolved = False
+    _cached_index_column: str | None = None
+
+    def get_index_column() -> str | None:
+        nonlocal _index_column_resolved, _cached_index_column
+        if not _index_column_resolved:
+            base = get_base_read_request()
+            _cached_index_column = _get_index_column(lib, base.symbol, base.as_of)
+            _index_column_resolved = True
+        return _cached_index_column
+
+    def source_generator(
+        with_columns: list[str] | None,
+        predicate: pl.Expr | None,
+        n_rows: int | None,
+        batch_size: int | None,
+    ) -> Iterator[pl.DataFrame]:
+        read_request = get_base_read_request()
+        if coalesce_window > 0 and n_rows is None and not _has_clauses(read_request.query_builder):
+            # As below, index predicates select a date_range rather than being pushed.
+            pushed_predicate, index_range = predicate, None
+            if predicate is not None and read_request.row_range is None:
+                index_column = get_index_column()
+                if index_column is not None:
+                    index_range, conjuncts = _extract_index_date_range(
+                        _split_conjuncts(predicate), index_column
+                    )
+                    pushed_predicate = reduce(operator.and_, conjuncts) if conjuncts else None
+            table = _read_coalescer.read(
+                lib,
+                read_request,
+                with_columns,
+                pushed_predicate,
+                coalesce_window,
+                translation_engine,
+                result_cache,
+                index_range,
+            )
+            df = cast(pl.DataFrame, pl.from_arrow(table, rechunk=False))
+            if predicate is not None:
+                df = df.filter(predicate)
+            if with_columns is not None:
+                df = df.select(with_columns)
+            if df.height > 0:
+                yield df
+            return
+
+        # Polars columns and predicates refer to the output of an aggregating query, so
+        # they cannot select stored columns or the date_range of the rows read.
+        aggregated = not _is_row_wise(read_request.query_builder)
+
+        if with_columns is not None and not aggregated:
+            read_request = read_request._replace(columns=with_columns)
+
+        conjuncts = _split_conjuncts(predicate) if predicate is not None else []
+
+        # Predicates on the datetime index become a date_range, so ArcticDB only fetches
+        # the matching segments. A ReadRequest cannot combine date_range with row_range.
+        if conjuncts and read_request.row_range is None and not aggregated:
+            index_column = get_index_column()
+            if index_column is not None:
+                date_range, conjuncts = _extract_index_date_range(conjuncts, index_column)
+                if date_range is not None:
+                    read_request = read_request._replace(
+                        date_range=_intersect_date_ranges(read_request.date_range, date_range)
+                    )
+
+        translated_predicate, residual_predicate = _push_conjuncts(
+            conjuncts, read_request.query_builder, translation_engine
+        )
+        if translated_predicate is not read_request.query_builder:
+            read_request = read_request._replace(query_builder=translated_predicate)
+
+        # n_rows counts rows that pass the whole predicate, so with a residual it can
+        # only be applied once the residual conjuncts are evaluated on the Polars side.
+        if (
+            residual_predicate is not None
+            and n_rows is not None
+            and batch_size is None
+            and _is_row_wise(read_request.query_builder)
+        ):
+            # Read lazily so that the reads stop once enough rows passed the residual.
+            batches = _iter_limited_batches(lib, read_request, None, result_cache)
+        else:
+            batches = _iter_read_request_batches(
+                lib,
+                read_request,
+                n_rows if residual_predicate is None else None,
+                batch_size,
+                read_threads,
+                prefetch,
+                batch_alignment,
+                result_cache,
+                read_processes,
+                uri,
+            )
+        if aggregated and with_columns is not None:
+            batches = (batch.select(with_columns) for batch in batches)
+        if residual_predicate is not None:
+            batches = _filter_batches(batches, residual_predicate, n_rows)
+        yield from batches
+
+    return source_generator, get_schema
+
+
+def _scan_lazy_dataframe(
+    source: LazyDataFrame,
+    translation_engine: TranslationEngine = "string",
+    read_threads: int = 1,
+    prefetch: int = 0,
+    batch_alignment: BatchAlignment = "rows",
+    result_cache: ResultCache | None = None,
+    row_range: tuple[int | None, int | None] | None = None,
+    date_range: tuple[dt.datetime | None, dt.datetime | None] | None = None,
+    coalesce_window: float = 0.0,
+    read_processes: int = 1,
+    uri: str | None = None,
+) -> pl.LazyFrame:
+    """Register a Polars IO source backed by an existing ArcticDB LazyDataFrame.
+
+    The LazyDataFrame may already carry ArcticDB-level QueryBuilder operations
+    (projections, filters). Any additional Polars predicates or
+    column selections are pushed down on top of those. A row_range or date_range
+    restricts the rows read ahead of those operations, without modifying source.
+    """
+
+    def get_read_request() -> ReadRequest:
+        read_request = cast(ReadRequest, source._to_read_request())  # type: ignore[attr-defined]
+        if row_range is not None:
+            if read_request.row_range is not None or read_request.date_range is not None:
+                raise ValueError("row_range cannot be combined with a LazyDataFrame range")
+            read_request = read_request._replace(row_range=row_range)
+        if date_range is not None:
+            if read_request.row_range is not None:
+                raise ValueError("date_range cannot be combined with a LazyDataFrame row_range")
+            start, end = date_range
+            read_request = read_request._replace(
+                date_range=_intersect_date_ranges(
+                    read_request.date_range,
+                    (
+                        None if start is None else pd.Timestamp(start),
+                        None if end is None else pd.Timestamp(end),
+                    ),
+                )
+            )
+        return read_request
+
+    return _register_arctic_source(
+        lib=cast(Library, source.lib),
+        schema_getter=lambda: cast(pl.Schema, source._collect_schema()),  # type: ignore[attr-defined]
+        read_request_getter=get_read_request,
+        translation_engine=translation_engine,
+        read_threads=read_threads,
+        prefetch=prefetch,
+        batch_alignment=batch_alignment,
+        result_cache=result_cache,
+        coalesce_window=coalesce_window,
+        read_processes=read_processes,
+        uri=uri,
+    )
+
+
+@overload
+def scan_arcticdb(
+    source: str,
+    lib_name: str,
+    symbol: str,
+    /,
+    *,
+    as_of: int | str | dt.datetime | None = None,
+    row_range: tuple[int | None, int | None] | None = None,
+    date_range: tuple[dt.datetime | None, dt.datetime | None] | None = None,
+    pin_version: bool = False,
+    tail: int | None = None,
+    computed: Sequence[pl.Expr] | None = None,
+    group_by: str | None = None,
+    resample: str | None = None,
+    agg: Sequence[pl.Expr] | None = None,
+    translation_engine: TranslationEngine = "string",
+    read_threads: int = 1,
+    read_processes: int = 1,
+    prefetch: int = 0,
+    batch_alignment: BatchAlignment = "rows",
+    result_cache: ResultCache | None = None,
+    coalesce_window: float = 0.0,
+) -> pl.LazyFrame: ...
+
+
+@overload
+def scan_arcticdb(
+    source: Library,
+    symbol: str,
+    /,
+    *,
+    as_of: int | str | dt.datetime | None = None,
+    row_range: tuple[int | None, int | None] | None = None,
+    date_range: tuple[dt.datetime | None, dt.datetime | None] | None = None,
+    pin_version: bool = False,
+    tail: int | None = None,
+    computed: Sequence[pl.Expr] | None = None,
+    group_by: str | None = None,
+    resample: str | None = None,
+    agg: Sequence[pl.Expr] | None = None,
+    translation_engine: TranslationEngine = "string",
+    read_threads: int = 1,
+    read_processes: int = 1,
+    prefetch: int = 0,
+    batch_alignment: BatchAlignment = "rows",
+    result_cache: ResultCache | None = None,
+    coalesce_window: float = 0.0,
+) -> pl.LazyFrame: ...
+
+
+@overload
+def scan_arcticdb(
+    source: LazyDataFrame,
+    /,
+    *,
+    row_range: tuple[int | None, int | None] | None = None,
+    date_range: tuple[dt.datetime | None, dt.datetime | None] | None = None,
+    tail: int | None = None,
+    translation_engine: TranslationEngine = "string",
+    read_threads: int = 1,
+    prefetch: int = 0,
+    batch_alignment: BatchAlignment = "rows",
+    result_cache: ResultCache | None = None,
+    coalesce_window: float = 0.0,
+) -> pl.LazyFrame: ...
+
+
+def scan_arcticdb(
+    source: str | Library | LazyDataFrame,
+    lib_name_or_symbol: str | None = None,
+    symbol: str | None = None,
+    /,
+    *,
+    as_of: int | str | dt.datetime | None = None,
+    row_range: tuple[int | None, int | None] | None = None,
+    date_range: tuple[dt.datetime | None, dt.datetime | None] | None = None,
+    pin_version: bool = False,
+    tail: int | None = None,
+    computed: Sequence[pl.Expr] | None = None,
+    group_by: str | None = None,
+    resample: str | None = None,
+    agg: Sequence[pl.Expr] | None = None,
+    translation_engine: TranslationEngine = "string",
+    read_threads: int = 1,
+    read_processes: int = 1,
+    prefetch: int = 0,
+    batch_alignment: BatchAlignment = "rows",
+    result_cache: ResultCache | None = None,
+    coalesce_window: float = 0.0,
+) -> pl.LazyFrame:
+    """
+    Create a Polars LazyFrame backed by an ArcticDB symbol.
+
+    Three calling forms are supported:
+
+    1. URI form (connections are pooled in ``library_pool`` and reused across calls)::
+           scan_arcticdb(uri, lib_name, symbol, *, as_of=None)
+
+    2. Library form (preferred for repeated calls against the same library)::
+           scan_arcticdb(lib, symbol, *, as_of=None)
+
+    3. LazyDataFrame form (pre-apply ArcticDB operations before Polars sees the data)::
+           scan_arcticdb(lazy_df)
+
+       ``computed``, ``group_by``, ``resample`` and ``agg`` are rejected for this form:
+       apply the equivalent ArcticDB operations to the LazyDataFrame itself.
+
+    With ``pin_version=True``, ``as_of`` is resolved once to a concrete version number
+    when the scan is created, so every collect() and schema lookup of the LazyFrame
+    reads that version even if new versions are written in the meantime.
+
+    ``result_cache`` takes a ``ResultCache`` such as ``MemoryResultCache`` or
+    ``DiskResultCache``, which serves repeated reads of a pinned version from cache
+    instead of storage.
+
+    ``row_range=(start, end)`` or ``date_range=(start, end)`` restrict the rows read,
+    like the ArcticDB ``read`` arguments of the same names. They apply before any
+    ArcticDB query of a LazyDataFrame and before ``group_by``/``resample``.
+
+    ``tail=n`` restricts the scan to the last ``n`` rows of the symbol, which are the
+    only rows read. Like ``row_range``, it applies before any LazyDataFrame query.
+    Polars does not hand ``lf.tail(n)`` to the source, so use this instead for
+    "latest rows" queries.
+
+    ``computed`` adds arithmetic columns evaluated by
+    ArcticDB through ``QueryBuilder.apply()``, named by each expression's output name.
+    Selecting only derived columns then transfers only those::
+
+        scan_arcticdb(lib, symbol, computed=[(pl.col("a") * pl.col("b")).alias("notional")])
+
+    ``group_by`` and ``agg`` aggregate on the ArcticDB
+    side through ``QueryBuilder.groupby().agg()``, so only the aggregated rows are
+    transferred. ``agg`` takes sum, mean, min, max and count of single columns,
+    optionally aliased::
+
+        scan_arcticdb(lib, symbol, group_by="label", agg=[pl.col("b").sum().alias("total")])
+
+    ``resample`` with ``agg`` instead buckets a datetime-indexed symbol into fixed
+    intervals through ``QueryBuilder.resample()``, like Polars'
+    ``group_by_dynamic(index, every=resample)``. It also takes first and last::
+
+        scan_arcticdb(lib, symbol, resample="1m", agg=[pl.col("price").last()])
+
+    Unlike Polars, ArcticDB's first and last skip missing (NaN) float values: for a
+    bucket ``[NaN, 1.0]``, ``first`` is 1.0 where Polars' ``first()`` is null.
+
+    For the URI and Library forms, schemas are shared between scans of the same symbol
+    version through ``schema_cache``.
+
+    LazyFrames from the URI form can be pickled, e.g. to collect them in a process
+    pool: their source is sent as a ``ScanSpec`` pinned to the version current at
+    pickling time, and rebuilt in the receiving process.
+
+    ``translation_engine`` selects how Polars predicates are translated for pushdown:
+    ``"string"`` re-parses the expression's string representation, ``"tree"`` walks
+    the serialized expression tree directly.
+
+    With ``read_threads > 1``, a non-streaming ``collect()`` splits the symbol into that
+    many segment-aligned row ranges and reads them concurrently. With ``prefetch > 0``,
+    streaming collection keeps up to that many batch reads running in background
+    threads while Polars processes the current batch.
+
+    ``batch_alignment`` controls streaming batch boundaries: ``"rows"`` slices by the
+    Polars batch size, ``"segments"`` yields one batch per stored segment so each one
+    is decoded once, and ``"coalesce"`` merges consecutive segments up to the batch size.
+
+    For the URI form, ``read_processes > 1`` instead reads those row ranges in a pool of
+    that many spawned worker processes, each opening the library from the URI. Workers
+    hand their results over as Arrow IPC files in shared memory, which are memory-mapped
+    into the resulting DataFrame without copying.
+
+    With ``coalesce_window > 0``, scans of the same symbol version that start within
+    that many seconds of each other, such as the inputs of one ``pl.collect_all()``,
+    share a single read of the union of their columns under the weakest common pushed
+    predicate. Each scan then selects and filters its own rows from the shared result.
+    The first scan of such a group waits the whole window before reading, adding
+    ``coalesce_window`` seconds of latency. After a scan that found nobody to share
+    with, the next scan of the same symbol version reads at once. The shared read is
+    a single whole read, handed to streaming collection as one batch, so
+    ``coalesce_window`` cannot be combined with ``read_threads``, ``read_processes``,
+    ``prefetch`` or ``batch_alignment``::
+
+        frames = [scan_arcticdb(lib, symbol, coalesce_window=0.01) for _ in range(3)]
+        pl.collect_all([frames[0].select("a"), frames[1].filter(...), ...])
+    """
+    if sum(option is not None for option in (row_range, date_range, tail)) > 1:
+        raise ValueError("Only one of row_range, date_range and tail may be given")
+    if read_processes > 1 and not isinstance(source, str):
+        raise ValueError("read_processes requires the URI form of scan_arcticdb")
+    uri = source if isinstance(source, str) else None
+    if tail is not None:
+        if tail < 0:
+            raise ValueError(f"tail must not be negative, got {tail}")
+        # A negative row_range start counts from the end; -0 would select every row.
+        row_range = (-tail, None) if tail > 0 else (0, 0)
+    if isinstance(source, LazyDataFrame):
+        if any(option is not None for option in (computed, group_by, resample, agg)):
+            raise ValueError(
+                "computed, group_by, resample and agg cannot be used with a LazyDataFrame"
+            )
+        return _scan_lazy_dataframe(
+            source,
+            translation_engine,
+            read_threads,
+            prefetch,
+            batch_alignment,
+            result_cache,
+            row_range,
+            date_range,
+            coalesce_window,
+        )
+    lib, symbol = _resolve_library(source, lib_name_or_symbol, symbol)
+
+    if pin_version:
+        as_of = _resolve_version(lib, symbol, as_of)
+
+    base_lazy_source = cast(
+        LazyDataFrame,
+        lib.read(
+            symbol,
+            as_of=as_of,
+            row_range=row_range,
+            date_range=date_range,
+            lazy=True,
+            output_format=OutputFormat.PYARROW,
+        ),
+    )
+
+    if computed:
+        description = lib.get_description(symbol, as_of=as_of)
+        base_lazy_source = _apply_computed_columns(
+            base_lazy_source,
+            computed,
+            translation_engine,
+            [
+                column.name
+                for column in (*description.index, *description.columns)
+                if column.name is not None
+            ],
+        )
+
+    if group_by is not None or resample is not None or agg is not None:
+        if not agg or (group_by is None) == (resample is None):
+            raise ValueError("agg must be given with exactly one of group_by or resample")
+        aggregations = _translate_aggregations(agg, resample=resample is not None)
+        if group_by is not None:
+            key_column = group_by
+            base_lazy_source = base_lazy_source.groupby(group_by)
+        else:
+            index_column = _get_index_column(lib, symbol, as_of)
+            if index_column is None:
+                raise ValueError(f"resample requires a datetime-indexed symbol: {symbol}")
+            key_column = index_column
+            # Polars group_by_dynamic windows are closed and labelled on the left.
+            base_lazy_source = base_lazy_source.resample(
+                _duration_to_rule(cast(str, resample)), closed="left", label="left"
+            )
+        aggregated = base_lazy_source.agg(dict(aggregations))
+        # ArcticDB does not preserve the order of the aggregation columns.
+        return _scan_lazy_dataframe(
+            aggregated,
+            translation_engine,
+            read_threads,
+            prefetch,
+            batch_alignment,
+            result_cache,
+            coalesce_window=coalesce_window,
+            read_processes=read_processes,
+            uri=uri,
+        ).select(key_column, *aggregations)
+
+    if computed:
+        # The schema includes the computed columns, so it is not shared via schema_cache.
+        return _scan_lazy_dataframe(
+            base_lazy_source,
+            translation_engine,
+            read_threads,
+            prefetch,
+            batch_alignment,
+            result_cache,
+            coalesce_window=coalesce_window,
+            read_processes=read_processes,
+            uri=uri,
+        )
+
+    return _register_arctic_source(
+        lib=lib,
+        # _load_symbol_schema() reads the schema from symbol metadata (no data IO),
+        # which is faster than parse_schema()'s row_range=(0,1) data read. Its result
+        # is shared with other scans of the same symbol version through schema_cache.
+        schema_getter=lambda: schema_cache.get(
+            lib, symbol, as_of, lambda version: _load_symbol_schema(lib, symbol, version)
+        ),
+        read_request_getter=lambda: cast(
+            ReadRequest,
+            base_lazy_source._to_read_request(),  # type: ignore[attr-defined]
+        ),
+        translation_engine=translation_engine,
+        read_threads=read_threads,
+        prefetch=prefetch,
+        batch_alignment=batch_alignment,
+        result_cache=result_cache,
+        coalesce_window=coalesce_window,
+        read_processes=read_processes,
+        uri=uri,
+    )
+
+
+AsOf = int | str | dt.datetime | None
+
+
+def _register_arctic_many_source(
+    lib: Library,
+    symbols: list[str],
+    as_of: AsOf | Mapping[str, AsOf],
+    date_range: tuple[dt.datetime | None, dt.datetime | None] | None,
+    symbol_column: str | None,
+    translation_engine: TranslationEngine,
+    read_processes: int = 1,
+    uri: str | None = None,
+) -> pl.LazyFrame:
+    _get_translator(translation_engine)
+
+    def symbol_as_of(symbol: str) -> AsOf:
+        return as_of.get(symbol) if isinstance(as_of, Mapping) else as_of
+
+    base_date_range: DateRange | None = None
+    if date_range is not None:
+        start, end = date_range
+        base_date_range = (
+            None if start is None else pd.Timestamp(start),
+            None if end is None else pd.Timestamp(end),
+        )
+
+    # Every symbol is assumed to share the schema and index of the first one.
+    first_symbol, first_as_of = symbols[0], symbol_as_of(symbols[0])
+    _cached_schema: pl.Schema | None = None
+
+    def get_schema() -> pl.Schema:
+        nonlocal _cached_schema
+        if _cached_schema is None:
+            schema = schema_cache.get(
+                lib,
+                first_symbol,
+                first_as_of,
+                lambda version: _load_symbol_schema(lib, first_symbol, version),
+            )
+            if symbol_column is not None:
+                schema = pl.Schema({**schema, symbol_column: pl.String()})
+            _cached_schema = schema
+        return _cached_schema
+
+    _index_column_resolved = False
+    _cached_index_column: str | None = None
+
+    def get_index_column() -> str | None:
+        nonlocal _index_column_resolved, _cached_index_column
+        if not _index_column_resolved:
+            _cached_index_column = _get_index_column(lib, first_symbol, first_as_of)
+            _index_column_resolved = True
+        return _cached_index_column
+
+    def read_batches(
+        columns: list[str] | None,
+        query_builder: QueryBuilder | None,
+        date_range: DateRange | None,
+        with_columns: list[str] | None,
+    ) -> Iterator[pl.DataFrame]:
+        read_requests = [
+            ReadRequest(
+                symbol,
+                as_of=symbol_as_of(symbol),
+                date_range=date_range,
+                columns=columns,
+                query_builder=query_builder,
+                output_format=OutputFormat.PYARROW,
+            )
+            for symbol in symbols
+        ]
+        if read_processes > 1 and uri is not None:
+            # One worker process per symbol, up to read_processes at a time.
+            tables = _read_shards(uri, lib.name, read_requests, read_processes)
+        else:
+            results = lib.read_batch(read_requests, output_format=OutputFormat.PYARROW)
+            tables = (
+                result if isinstance(result, DataError) else cast(pa.Table, result.data)
+                for result in results
+            )
+        for symbol in symbols:
+            try:
+                arrow_table = next(tables)
+            except Exception as error:
+                raise RuntimeError(f"Failed to read symbol {symbol}: {error}") from error
+            if isinstance(arrow_table, DataError):
+                raise RuntimeError(
+                    f"Failed to read symbol {symbol}: {arrow_table.exception_string}"
+                )
+            if arrow_table.num_rows == 0:
+                continue
+            batch = cast(pl.DataFrame, pl.from_arrow(arrow_table, rechunk=False))
+            if symbol_column is not None:
+                batch = batch.with_columns(pl.lit(symbol, dtype=pl.String).alias(symbol_column))
+            if with_columns is not None:
+                batch = batch.select(with_columns)
+            yield batch
+
+    def source_generator(
+        with_columns: list[str] | None,
+        predicate: pl.Expr | None,
+        n_rows: int | None,
+        batch_size: int | None,
+    ) -> Iterator[pl.DataFrame]:
+        columns = with_columns
+        if columns is not None and symbol_column is not None:
+            columns = [column for column in columns if column != symbol_column]
+
+        conjuncts = _split_conjuncts(predicate) if predicate is not None else []
+        # The symbol column only exists on the Polars side.
+        symbol_conjuncts: list[pl.Expr] = []
+        if symbol_column is not None:
+            pushable = []
+            for conjunct in conjuncts:
+                if symbol_column in conjunct.meta.root_names():
+                    symbol_conjuncts.append(conjunct)
+                else:
+                    pushable.append(conjunct)
+            conjuncts = pushable
+
+        read_date_range = base_date_range
+        if conjuncts:
+            index_column = get_index_column()
+            if index_column is not None:
+                index_range, conjuncts = _extract_index_date_range(conjuncts, index_column)
+                if index_range is not None:
+                    read_date_range = _intersect_date_ranges(read_date_range, index_range)
+
+        query_builder, residual_predicate = _push_conjuncts(conjuncts, None, translation_engine)
+        residuals = symbol_conjuncts + (
+            [residual_predicate] if residual_predicate is not None else []
+        )
+        if not residuals and n_rows is not None:
+            query_builder = _with_head(query_builder, n_rows)
+
+        batches = read_batches(columns, query_builder, read_date_range, with_columns)
+        if residuals:
+            residual = residuals[0] if len(residuals) == 1 else pl.all_horizontal(residuals)
+            yield from _filter_batches(batches, residual, n_rows)
+            return
+        remaining_rows = n_rows
+        for batch in batches:
+            if remaining_rows is not None:
+                batch = batch.head(remaining_rows)
+                remaining_rows -= batch.height
+            if batch.height > 0:
+                yield batch
+            if remaining_rows == 0:
+                return
+
+    return pl.io.plugins.register_io_source(  # type: ignore[attr-defined]
+        io_source=source_generator,
+        schema=get_schema,
+    )
+
+
+@overload
+def scan_arcticdb_many(
+    source: str,
+    lib_name: str,
+    symbols: Sequence[str],
+    /,
+    *,
+    as_of: AsOf | Mapping[str, AsOf] = None,
+    date_range: tuple[dt.datetime | None, dt.datetime | None] | None = None,
+    symbol_column: str | None = None,
+    translation_engine: TranslationEngine = "string",
+    read_processes: int = 1,
+) -> pl.LazyFrame: ...
+
+
+@overload
+def scan_arcticdb_many(
+    source: Library,
+    symbols: Sequence[str],
+    /,
+    *,
+    as_of: AsOf | Mapping[str, AsOf] = None,
+    date_range: tuple[dt.datetime | None, dt.datetime | None] | None = None,
+    symbol_column: str | None = None,
+    translation_engine: TranslationEngine = "string",
+    read_processes: int = 1,
+) -> pl.LazyFrame: ...
+
+
+def scan_arcticdb_many(
+    source: str | Library,
+    lib_name_or_symbols: str | Sequence[str],
+    symbols: Sequence[str] | None = None,
+    /,
+    *,
+    as_of: AsOf | Mapping[str, AsOf] = None,
+    date_range: tuple[dt.datetime | None, dt.datetime | None] | None = None,
+    symbol_column: str | None = None,
+    translation_engine: TranslationEngine = "string",
+    read_processes: int = 1,
+) -> pl.LazyFrame:
+    """
+    Create one Polars LazyFrame over several ArcticDB symbols with the same schema.
+
+    Equivalent to ``pl.concat([scan_arcticdb(lib, s) for s in symbols])``, but all the
+    symbols are fetched with a single ``lib.read_batch`` call carrying the same
+    projection and translated predicate, so ArcticDB can parallelise the I/O. Takes
+    the URI or Library calling forms of ``scan_arcticdb``::
+
+        scan_arcticdb_many(lib, ["AAPL", "MSFT"], symbol_column="symbol")
+
+    ``as_of`` applies to every symbol, or maps symbols to their own version. With
+    ``symbol_column``, a string column holding each row's symbol is appended;
+    predicates on it are evaluated by Polars.
+
+    For the URI form, ``read_processes > 1`` reads the symbols in a pool of that many
+    spawned worker processes instead, handing each result over through shared memory
+    like ``scan_arcticdb(..., read_processes=n)``.
+    """
+    if isinstance(source, str):
+        if not isinstance(lib_name_or_symbols, str) or symbols is None:
+            raise ValueError("lib_name and symbols are required when source is a URI string")
+        lib = _get_library_from_uri(source, lib_name_or_symbols)
+    elif isinstance(source, Library):
+        if isinstance(lib_name_or_symbols, str):
+            raise ValueError("symbols must be a sequence of symbol names, not a string")
+        lib, symbols = source, lib_name_or_symbols
+    else:
+        raise TypeError(f"Unsupported source type: {type(source).__name__}")
+    if not symbols:
+        raise ValueError("symbols must not be empty")
+    if read_processes < 1:
+        raise ValueError(f"read_processes must be at least 1, got {read_processes}")
+    if read_processes > 1 and not isinstance(source, str):
+        raise ValueError("read_processes requires the URI form of scan_arcticdb_many")
+
+    return _register_arctic_many_source(
+        lib,
+        list(symbols),
+        as_of,
+        date_range,
+        symbol_column,
+        translation_engine,
+        read_processes,
+        source if isinstance(source, str) else None,
+    )
+
+
+def _count_index_rows(
+    lib: Library,
+    symbol: str,
+    as_of: int | str | dt.datetime | None,
+    date_range: tuple[Any, Any],
+) -> int:
+    """
+    Count rows with an index inside date_range from the index key's segment ranges.
+
+    Segments entirely inside the range are counted from their row bounds; only the
+    index column of the (at most two) segments straddling a bound is read.
+    """
+    start, end = (
+        None if bound is None else _to_utc_naive(pd.Timestamp(bound)) for bound in date_range
+    )
+    segments = _read_segment_index(lib, symbol, as_of)
+    count = 0
+    for segment_start, segment_end, start_row, end_row in zip(
+        pd.DatetimeIndex(segments.index),
+        # end_index is exclusive: one nanosecond past the last index value.
+        pd.DatetimeIndex(segments["end_index"]) - pd.Timedelta(1, unit="ns"),
+        segments["start_row"].tolist(),
+        segments["end_row"].tolist(),
+        strict=True,
+    ):
+        if (end is not None and segment_start > end) or (start is not None and segment_end < start):
+            continue
+        if (start is None or segment_start >= start) and (end is None or segment_end <= end):
+            count += end_row - start_row
+            continue
+        table = cast(
+            pa.Table,
+            lib.read(
+                symbol,
+                as_of=as_of,
+                row_range=(start_row, end_row),
+                columns=[],
+                output_format=OutputFormat.PYARROW,
+            ).data,
+        )
+        timestamps = pd.DatetimeIndex(table.column(0).to_pandas())
+        if timestamps.tz is not None:
+            timestamps = timestamps.tz_convert(None)
+        in_range = np.ones(len(timestamps), dtype=bool)
+        if start is not None:
+            in_range &= timestamps >= start
+        if end is not None:
+            in_range &= timestamps <= end
+        count += int(in_range.sum())
+    return count
+
+
+@overload
+def count_arcticdb(
+    source: str,
+    lib_name: str,
+    symbol: str,
+    /,
+    *,
+    as_of: int | str | dt.datetime | None = None,
+    date_range: tuple[Any, Any] | None = None,
+) -> int: ...
+
+
+@overload
+def count_arcticdb(
+    source: Library,
+    symbol: str,
+    /,
+    *,
+    as_of: int | str | dt.datetime | None = None,
+    date_range: tuple[Any, Any] | None = None,
+) -> int: ...
+
+
+def count_arcticdb(
+    source: str | Library,
+    lib_name_or_symbol: str | None = None,
+    symbol: str | None = None,
+    /,
+    *,
+    as_of: int | str | dt.datetime | None = None,
+    date_range: tuple[Any, Any] | None = None,
+) -> int:
+    """
+    Count the rows of an ArcticDB symbol from its metadata, without reading column data.
+
+    This answers ``scan_arcticdb(...).select(pl.len())`` without a data read; the
+    Polars IO plugin cannot tell a row count from a read of one column, so counting
+    takes this explicit call. Takes the URI or Library calling forms of
+    ``scan_arcticdb``::
+
+        count_arcticdb(lib, symbol, date_range=(start, end))
+
+    With ``date_range`` (inclusive, either bound may be None) only rows of a
+    datetime-indexed symbol inside the range are counted.
+    """
+    lib, symbol = _resolve_library(source, lib_name_or_symbol, symbol)
+    description = lib.get_description(symbol, as_of=as_of)
+    if date_range is None or description.row_count == 0:
+        return int(description.row_count)
+    if _description_index_column(description) is None:
+        raise ValueError(f"date_range requires a datetime-indexed symbol: {symbol}")
+    return _count_index_rows(lib, symbol, as_of, date_range)
+
+
+@overload
+def index_range_arcticdb(
+    source: str,
+    lib_name: str,
+    symbol: str,
+    /,
+    *,
+    as_of: int | str | dt.datetime | None = None,
+) -> DateRange: ...
+
+
+@overload
+def index_range_arcticdb(
+    source: Library,
+    symbol: str,
+    /,
+    *,
+    as_of: int | str | dt.datetime | None = None,
+) -> DateRange: ...
+
+
+def index_range_arcticdb(
+    source: str | Library,
+    lib_name_or_symbol: str | None = None,
+    symbol: str | None = None,
+    /,
+    *,
+    as_of: int | str | dt.datetime | None = None,
+) -> DateRange:
+    """
+    First and last timestamp of a datetime-indexed ArcticDB symbol, from its metadata.
+
+    Equivalent to ``select(pl.col(index).min(), pl.col(index).max())`` on a scan, read
+    from the symbol description without touching data segments. Returns
+    ``(None, None)`` for an empty symbol. Takes the URI or Library calling forms of
+    ``scan_arcticdb``.
+    """
+    lib, symbol = _resolve_library(source, lib_name_or_symbol, symbol)
+    description = lib.get_description(symbol, as_of=as_of)
+    if description.row_count == 0:
+        return None, None
+    if _description_index_column(description) is None:
+        raise ValueError(f"index_range_arcticdb requires a datetime-indexed symbol: {symbol}")
+    first, last = description.date_range
+    return (
+        None if pd.isna(first) else pd.Timestamp(first),
+        None if pd.isna(last) else pd.Timestamp(last),
+    )
+
+
+CollectEngine = Literal["auto", "in-memory", "streaming"]
+
+
+class AsyncCollector:
+    """
+    Bounded thread pool collecting LazyFrames on behalf of asyncio code.
+
+    ``collect()`` runs ``LazyFrame.collect()``, and therefore its ArcticDB reads, on
+    one of at most ``max_workers`` threads, so the event loop stays responsive and
+    excess collections queue instead of spawning threads. Cancelling an awaiting task
+    drops its collection if it has not started yet; a running collection completes in
+    the background and its result is discarded. A forked child starts a new pool.
+
+    Usage:
+        frames = await asyncio.gather(*(async_collector.collect(lf) for lf in lfs))
+    """
+
+    def __init__(self, max_workers: int = 8) -> None:
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._executor: ThreadPoolExecutor | None = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pid != os.getpid():
+                # The worker threads of the parent do not exist in a forked child.
+                self._pid = os.getpid()
+                self._executor = None
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="polarctic-collect"
+                )
+            return self._executor
+
+    async def collect(self, lf: pl.LazyFrame, *, engine: CollectEngine = "auto") -> pl.DataFrame:
+        """Collect ``lf`` on the pool without blocking the running event loop."""
+
+        def collect() -> pl.DataFrame:
+            return lf.collect(engine=engine)
+
+        return await asyncio.get_running_loop().run_in_executor(self._get_executor(), collect)
+
+    def shutdown(self, cancel_pending: bool = True) -> None:
+        """
+        Stop the pool without waiting for running collections.
+
+        With ``cancel_pending``, queued collections are cancelled. A later ``collect()``
+        starts a new pool.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=cancel_pending)
+
+
+async_collector = AsyncCollector()
+
+
+async def collect_arcticdb_async(
+    lf: pl.LazyFrame,
+    *,
+    engine: CollectEngine = "auto",
+    collector: AsyncCollector | None = None,
+) -> pl.DataFrame:
+    """
+    Collect a LazyFrame, such as one from ``scan_arcticdb``, from asyncio code.
+
+    The collection runs on ``collector``, by default the shared ``async_collector``,
+    so many scans can be awaited concurrently::
+
+        frames = await asyncio.gather(collect_arcticdb_async(lf1), collect_arcticdb_async(lf2))
+    """
+    return await (collector or async_collector).collect(lf, engine=engine)
@@ -20,7 +20,7 @@ import polars as pl
 import pytest
 from arcticdb import QueryBuilder
 
-from polarctic.polarctic import PolarsToArcticDBTranslator
+from polarctic.polarctic import PolarsExprTreeTranslator, PolarsToArcticDBTranslator
 
 
 @pytest.fixture(scope="module")
@@ -275,3 +275,40 @@ def bench_complex_nested(
 ) -> None:
     """Three-clause AND/OR expression to stress the recursive tree walk."""
     benchmark(lambda: translator.translate(exprs["complex_nested"], QueryBuilder()))
+
+
+# ---------------------------------------------------------------------------
+# Tree engine (serialized expression tree, no str()/regex/ast round-trip)
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="module")
+def tree_translator() -> PolarsExprTreeTranslator:
+    return PolarsExprTreeTranslator()
+
+
+@pytest.mark.parametrize(
+    "name",
+    ["greater", "and", "or", "not", "is_not_null", "str_contains", "isin", "complex_nested"],
+)
+def bench_tree_engine(
+    benchmark: Any,
+    tree_translator: PolarsExprTreeTranslator,
+    exprs: dict[str, pl.Expr],
+    name: str,
+) -> None:
+    benchmark(lambda: tree_translator.translate(exprs[name], QueryBuilder()))
+
+
+@pytest.mark.benchmark(group="isin_engines")
+@pytest.mark.parametrize("engine", ["string", "tree"])
+def bench_isin_engine_comparison(
+    benchmark: Any,
+    translator: PolarsToArcticDBTranslator,
+    tree_translator: PolarsExprTreeTranslator,
+    exprs: dict[str, pl.Expr],
+    engine: str,
+) -> None:
+    """is_in decodes its values from an Arrow IPC payload in the tree engine."""
+    engine_translator = translator if engine == "string" else tree_translator
+    benchmark(lambda: engine_translator.translate(exprs["isin"], QueryBuilder()))
@@ -8,9 +8,10 @@ License, use of this software will be governed by the Apache License, version 2.
 """
 
 import gc
+import inspect
 import shutil
 import time
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
 from pathlib import Path
 from typing import Any
 
@@ -19,7 +20,67 @@ import pandas as pd
 import pytest
 from arcticdb import Arctic
 
-from polarctic.polarctic import PolarsToArcticDBTranslator
+from polarctic.polarctic import (
+    PolarsExprTreeTranslator,
+    PolarsToArcticDBTranslator,
+    library_pool,
+)
+
+
+class ReadRecorder:
+    """
+    Stand-in for a Library read method that records every call before delegating.
+
+    ``calls`` holds the arguments of each call by parameter name, ``results`` what each
+    returned. ``read`` is the original method, for reads that should not be recorded.
+    With ``delay``, each call first sleeps that many seconds, so concurrent reads overlap.
+    ``before`` is called with the arguments of each call ahead of the read itself.
+    """
+
+    def __init__(
+        self,
+        read: Callable[..., Any],
+        delay: float = 0.0,
+        before: Callable[[dict[str, Any]], None] | None = None,
+    ) -> None:
+        self.read = read
+        self.delay = delay
+        self.before = before
+        self.calls: list[dict[str, Any]] = []
+        self.results: list[Any] = []
+        self._signature = inspect.signature(read)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        call = dict(self._signature.bind(*args, **kwargs).arguments)
+        self.calls.append(call)
+        if self.before is not None:
+            self.before(call)
+        if self.delay:
+            time.sleep(self.delay)
+        result = self.read(*args, **kwargs)
+        self.results.append(result)
+        return result
+
+    def clear(self) -> None:
+        self.calls.clear()
+        self.results.clear()
+
+
+@pytest.fixture
+def record_reads(monkeypatch: pytest.MonkeyPatch) -> Callable[..., ReadRecorder]:
+    """Replace ``lib.read`` (or another read method) with a ReadRecorder for the test."""
+
+    def record(
+        lib: Any,
+        delay: float = 0.0,
+        method: str = "read",
+        before: Callable[[dict[str, Any]], None] | None = None,
+    ) -> ReadRecorder:
+        recorder = ReadRecorder(getattr(lib, method), delay, before)
+        monkeypatch.setattr(lib, method, recorder)
+        return recorder
+
+    return record
 
 
 @pytest.fixture
@@ -27,6 +88,11 @@ def translator() -> PolarsToArcticDBTranslator:
     return PolarsToArcticDBTranslator()
 
 
+@pytest.fixture
+def tree_translator() -> PolarsExprTreeTranslator:
+    return PolarsExprTreeTranslator()
+
+
 @pytest.fixture
 def init_arcticdb(tmp_path: Path) -> dict[str, Any]:
     """
@@ -94,7 +160,9 @@ def delete_arcticdb(init_arcticdb: dict[str, Any]) -> Iterator[None]:
     lmdb_path = init_arcticdb["lmdb_path"]
     ac = init_arcticdb["ac"]
 
-    # Drop strong references held by the fixture dict before deleting on-disk state.
+    # Drop strong references held by the fixture dict and the library pool before
+    # deleting on-disk state.
+    library_pool.invalidate(init_arcticdb["uri"])
     init_arcticdb.pop("lib", None)
     init_arcticdb.pop("tables", None)
     gc.collect()
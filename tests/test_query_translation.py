@@ -1,12 +1,14 @@
 import ast
+import datetime as dt
 from typing import Any
 
+import pandas as pd
 import polars as pl
 import pytest
 from arcticdb import QueryBuilder
 
 import polarctic.polarctic as polarctic_module
-from polarctic.polarctic import PolarsToArcticDBTranslator
+from polarctic.polarctic import PolarsExprTreeTranslator, PolarsToArcticDBTranslator
 
 """
 Copyright 2026 Man Group Operations Limited
@@ -341,3 +343,197 @@ def test_translate_predicate_falls_back_on_unsupported_predicate(
     assert (
         polarctic_module._translate_predicate(pl.col("a"), base_query_builder) is base_query_builder
     )
+
+
+@pytest.mark.parametrize(
+    "expr",
+    [
+        pl.col("col1") > 2,
+        pl.col("col1") >= 2,
+        pl.col("col1") < 2.5,
+        pl.col("col1") <= 2,
+        pl.col("col1") == "x",
+        pl.col("col1") != 2,
+        pl.col("col1") + pl.col("col2"),
+        pl.col("col1") - pl.col("col2"),
+        pl.col("col1") * pl.col("col2"),
+        pl.col("col1") / pl.col("col2"),
+        -pl.col("col1"),
+        (pl.col("col1") > 2) & (pl.col("col2") < 3),
+        (pl.col("col1") > 2).or_(pl.col("col2") < 3),
+        (pl.col("col1") & 1) == 0,
+        (pl.col("col1") | 1) == 3,
+        (pl.col("col1") ^ 1) == 3,
+        ~pl.col("col1"),
+        pl.col("col1").abs(),
+        pl.col("col1").is_null(),
+        ~pl.col("col1").is_null(),
+        pl.col("col1").str.contains("e+"),
+        pl.col("col1").is_in([24, 42]),
+        pl.col("col1").is_in(["x", "y"]),
+    ],
+)
+def test_tree_translator_matches_string_translator(
+    translator: PolarsToArcticDBTranslator,
+    tree_translator: PolarsExprTreeTranslator,
+    expr: pl.Expr,
+) -> None:
+    assert tree_translator.translate(expr, QueryBuilder()) == translator.translate(
+        expr, QueryBuilder()
+    )
+
+
+def test_tree_translator_is_not_null(tree_translator: PolarsExprTreeTranslator) -> None:
+    q = tree_translator.translate(pl.col("col1").is_not_null(), QueryBuilder())
+    qe = make_query_builder()
+    qe = qe[qe["col1"].notnull()]
+    assert q == qe
+
+
+def test_tree_translator_literal_contains(tree_translator: PolarsExprTreeTranslator) -> None:
+    q = tree_translator.translate(pl.col("col1").str.contains("a.b", literal=True), QueryBuilder())
+    qe = make_query_builder()
+    qe = qe[qe["col1"].regex_match(r"a\.b")]
+    assert q == qe
+
+
+def test_tree_translator_datetime_literals(tree_translator: PolarsExprTreeTranslator) -> None:
+    naive = tree_translator.translate(pl.col("ts") >= dt.datetime(2024, 1, 1), QueryBuilder())
+    aware = tree_translator.translate(
+        pl.col("ts") >= dt.datetime(2024, 1, 1, tzinfo=dt.timezone.utc), QueryBuilder()
+    )
+    qe = make_query_builder()
+    qe = qe[qe["ts"] >= pd.Timestamp("2024-01-01")]
+    assert naive == qe
+    assert aware == qe
+
+
+def test_tree_translator_unsupported_nodes(tree_translator: PolarsExprTreeTranslator) -> None:
+    with pytest.raises(NotImplementedError, match="Operator Modulus not supported"):
+        tree_translator.translate(pl.col("col1") % pl.col("col2"), QueryBuilder())
+
+    with pytest.raises(NotImplementedError, match="Function Uppercase not supported"):
+        tree_translator.translate(pl.col("col1").str.to_uppercase() == "X", QueryBuilder())
+
+    with pytest.raises(NotImplementedError, match="Null literals not supported"):
+        tree_translator.translate(pl.col("col1") > pl.lit(None), QueryBuilder())
+
+    with pytest.raises(NotImplementedError, match="Node type Cast not supported"):
+        tree_translator.translate(pl.col("col1").cast(pl.Int32) > 1, QueryBuilder())
+
+
+def test_translate_predicate_selects_engine(monkeypatch: pytest.MonkeyPatch) -> None:
+    def raise_not_implemented(_predicate: pl.Expr, _query_builder: QueryBuilder) -> Any:
+        raise NotImplementedError("unsupported")
+
+    monkeypatch.setattr(polarctic_module._TRANSLATOR, "translate", raise_not_implemented)
+
+    translated = polarctic_module._translate_predicate(pl.col("a") > 1, QueryBuilder(), "tree")
+    qe = make_query_builder()
+    qe = qe[qe["a"] > 1]
+    assert translated == qe
+
+    with pytest.raises(ValueError, match="Unsupported translation engine"):
+        polarctic_module._translate_predicate(pl.col("a") > 1, QueryBuilder(), "regex")  # type: ignore[arg-type]
+
+
+def test_split_conjuncts_flattens_top_level_and_only() -> None:
+    a = pl.col("a") > 1
+    b = pl.col("b") < 3
+    c = (pl.col("c") == 1) | (pl.col("d") == 2)
+
+    conjuncts = polarctic_module._split_conjuncts((a & b) & c)
+    assert [str(conjunct) for conjunct in conjuncts] == [str(a), str(b), str(c)]
+
+    assert [str(x) for x in polarctic_module._split_conjuncts(c)] == [str(c)]
+
+
+def test_split_predicate_pushes_supported_conjuncts() -> None:
+    unsupported = pl.col("s").str.to_uppercase() == "X"
+    predicate = (pl.col("a") > 5) & unsupported & (pl.col("b") < 3)
+
+    query_builder, residual = polarctic_module._split_predicate(predicate)
+
+    qe = make_query_builder()
+    qe = qe[qe["a"] > 5]
+    qe = qe[qe["b"] < 3]
+    assert query_builder == qe
+    assert residual is not None
+    assert str(residual) == str(unsupported)
+
+
+def test_split_predicate_combines_residual_conjuncts() -> None:
+    first = pl.col("a") % 2 == 0
+    second = pl.col("s").str.to_uppercase() == "X"
+    base_query_builder = QueryBuilder()
+
+    query_builder, residual = polarctic_module._split_predicate(first & second, base_query_builder)
+
+    assert query_builder is base_query_builder
+    assert residual is not None
+    assert str(residual) == str(pl.all_horizontal([first, second]))
+
+
+def test_extract_index_date_range() -> None:
+    start = dt.datetime(2024, 1, 1)
+    end = dt.datetime(2024, 2, 1)
+    other = pl.col("a") > 1
+    strict = pl.col("ts") < end
+
+    date_range, remaining = polarctic_module._extract_index_date_range(
+        [pl.col("ts") >= start, other, strict], "ts"
+    )
+    assert date_range == (pd.Timestamp(start), pd.Timestamp(end))
+    assert [str(conjunct) for conjunct in remaining] == [str(other), str(strict)]
+
+    date_range, remaining = polarctic_module._extract_index_date_range(
+        [pl.col("ts").is_between(start, end), pl.lit(start) <= pl.col("ts")], "ts"
+    )
+    assert date_range == (pd.Timestamp(start), pd.Timestamp(end))
+    assert remaining == []
+
+    conjuncts = [pl.col("other_ts") >= start, pl.col("ts") >= pl.col("other_ts")]
+    assert polarctic_module._extract_index_date_range(conjuncts, "ts") == (None, conjuncts)
+
+
+def test_translate_aggregations() -> None:
+    aggs = [
+        pl.col("b").sum(),
+        pl.col("b").mean().alias("b_mean"),
+        pl.col("c").min().alias("c_min"),
+        pl.col("c").max().alias("c_max"),
+        pl.col("c").count().alias("n"),
+        pl.col("d").first(),
+        pl.col("e").last(),
+    ]
+    assert polarctic_module._translate_aggregations(aggs, resample=True) == {
+        "b": ("b", "sum"),
+        "b_mean": ("b", "mean"),
+        "c_min": ("c", "min"),
+        "c_max": ("c", "max"),
+        "n": ("c", "count"),
+        "d": ("d", "first"),
+        "e": ("e", "last"),
+    }
+
+    for unsupported in [pl.col("b").median(), (pl.col("b") * 2).sum(), pl.len(), pl.col("b")]:
+        with pytest.raises(ValueError, match="Cannot push down aggregation"):
+            polarctic_module._translate_aggregations([unsupported])
+    with pytest.raises(ValueError, match="Duplicate aggregation output column"):
+        polarctic_module._translate_aggregations([pl.col("b").sum(), pl.col("b").mean()])
+    with pytest.raises(ValueError, match="Aggregation first requires resample"):
+        polarctic_module._translate_aggregations(aggs)
+
+
+@pytest.mark.parametrize(
+    ("every", "rule"),
+    [("1m", "min"), ("30s", "30s"), ("1h30m", "90min"), ("1d", "D"), ("250ms", "250ms")],
+)
+def test_duration_to_rule(every: str, rule: str) -> None:
+    assert polarctic_module._duration_to_rule(every) == rule
+
+
+@pytest.mark.parametrize("every", ["1mo", "1w", "1y", "0s", "m", "1m foo"])
+def test_duration_to_rule_rejects_calendar_intervals(every: str) -> None:
+    with pytest.raises(ValueError, match="Cannot push down resample interval"):
+        polarctic_module._duration_to_rule(every)
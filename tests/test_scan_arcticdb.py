@@ -1,10 +1,23 @@
-from typing import Any
-
+import asyncio
+import datetime as dt
+import multiprocessing
+import os
+import pickle
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, cast
+
+import numpy as np
 import pandas as pd
 import pandas.testing as pdt
 import polars as pl
+import pyarrow as pa
 import pytest
-from arcticdb import OutputFormat, QueryBuilder, VersionedItem
+from arcticdb import LazyDataFrame, LibraryOptions, OutputFormat, QueryBuilder, VersionedItem
+from arcticdb.version_store.library import ReadRequest
 
 import polarctic.polarctic as polarctic_module
 
@@ -32,12 +45,18 @@ before the test and teardown removes the LMDB store afterwards.
 
 
 FixtureInfo = dict[str, Any]
+# The record_reads fixture: takes a Library and returns its conftest.ReadRecorder.
+RecordReads = Callable[..., Any]
 
 
 def make_query_builder() -> Any:
     return QueryBuilder()
 
 
+def lf_read_request(lib: Any, symbol: str) -> Any:
+    return lib.read(symbol, lazy=True, output_format=OutputFormat.PYARROW)._to_read_request()
+
+
 def test_parse_schema_returns_expected_schema(
     init_arcticdb: FixtureInfo, delete_arcticdb: object
 ) -> None:
@@ -343,3 +362,1249 @@ def test_scan_arcticdb_validates_input_combinations(
 
     with pytest.raises(TypeError, match="Unsupported source type"):
         polarctic_module.scan_arcticdb(123)  # type: ignore[arg-type]
+
+
+def test_scan_arcticdb_tree_translation_engine(
+    init_arcticdb: FixtureInfo,
+    delete_arcticdb: object,
+) -> None:
+    lib = init_arcticdb["lib"]
+    expected = init_arcticdb["tables"]["df1"]
+
+    lf = polarctic_module.scan_arcticdb(lib, "df1", translation_engine="tree")
+    result = lf.filter((pl.col("a") > 4) & (pl.col("ts") < pd.Timestamp("2020-01-09"))).collect()
+
+    pdt.assert_frame_equal(
+        result.to_pandas(),
+        expected[(expected["a"] > 4) & (expected["ts"] < "2020-01-09")].reset_index(drop=True),
+        check_dtype=False,
+        check_like=True,
+    )
+
+    with pytest.raises(ValueError, match="Unsupported translation engine"):
+        polarctic_module.scan_arcticdb(lib, "df1", translation_engine="regex")  # type: ignore[call-overload]
+
+
+def test_scan_arcticdb_partial_predicate_pushdown(
+    init_arcticdb: FixtureInfo,
+    delete_arcticdb: object,
+    record_reads: RecordReads,
+) -> None:
+    lib = init_arcticdb["lib"]
+    reads = record_reads(lib)
+
+    lf = polarctic_module.scan_arcticdb(lib, "df1")
+    result = lf.filter((pl.col("a") > 4) & ((pl.col("a") % 2) == 0)).collect()
+
+    assert result["a"].to_list() == [6, 8]
+    qe = make_query_builder()
+    qe = qe[qe["a"] > 4]
+    assert reads.calls[-1]["query_builder"] == qe
+
+
+def test_scan_arcticdb_unsupported_predicate_is_applied_in_polars(
+    init_arcticdb: FixtureInfo,
+    delete_arcticdb: object,
+) -> None:
+    lib = init_arcticdb["lib"]
+
+    lf = polarctic_module.scan_arcticdb(lib, "df1")
+    result = lf.filter((pl.col("a") % 3) == 0).collect()
+    assert result["a"].to_list() == [0, 3, 6, 9]
+
+
+def test_filter_batches_applies_n_rows_after_filtering() -> None:
+    batches = iter([pl.DataFrame({"a": [0, 1, 2, 3]}), pl.DataFrame({"a": [4, 5, 6, 7]})])
+
+    filtered = list(polarctic_module._filter_batches(batches, pl.col("a") % 2 == 1, n_rows=3))
+
+    assert [batch["a"].to_list() for batch in filtered] == [[1, 3], [5]]
+
+
+def test_scan_arcticdb_index_predicate_becomes_date_range(
+    init_arcticdb: FixtureInfo,
+    delete_arcticdb: object,
+    record_reads: RecordReads,
+) -> None:
+    lib = init_arcticdb["lib"]
+    indexed = init_arcticdb["tables"]["df1"].set_index("ts")
+    lib.write("indexed", indexed)
+    reads = record_reads(lib)
+
+    lf = polarctic_module.scan_arcticdb(lib, "indexed")
+    predicate = (pl.col("ts") >= dt.datetime(2020, 1, 3)) & (pl.col("ts") < dt.datetime(2020, 1, 6))
+
+    for engine in ["in-memory", "streaming"]:
+        result = lf.filter(predicate & (pl.col("a") > 3)).collect(engine=engine)  # type: ignore[call-overload]
+        assert result["a"].to_list() == [4]
+
+    reads.clear()
+    result = lf.filter(predicate).collect()
+    assert result["a"].to_list() == [2, 3, 4]
+    expected_qb = QueryBuilder().date_range(
+        (pd.Timestamp("2020-01-03"), pd.Timestamp("2020-01-06"))
+    )
+    assert reads.calls[-1]["query_builder"] == expected_qb
+
+    batches = list(
+        polarctic_module._iter_read_request_batches(
+            lib,
+            lf_read_request(lib, "indexed")._replace(
+                date_range=(pd.Timestamp("2020-01-03"), pd.Timestamp("2020-01-05"))
+            ),
+            n_rows=None,
+            batch_size=2,
+        )
+    )
+    assert pl.concat(batches)["a"].to_list() == [2, 3, 4]
+
+
+def test_iter_read_request_batches_streaming_with_filter_reads_every_slice(
+    init_arcticdb: FixtureInfo,
+    delete_arcticdb: object,
+) -> None:
+    lib = init_arcticdb["lib"]
+    query_builder = make_query_builder()
+    query_builder = query_builder[query_builder["a"] > 2]
+    read_request = lf_read_request(lib, "df1")._replace(query_builder=query_builder)
+
+    batches = list(
+        polarctic_module._iter_read_request_batches(lib, read_request, n_rows=None, batch_size=4)
+    )
+    assert pl.concat(batches)["a"].to_list() == [3, 4, 5, 6, 7, 8, 9]
+
+    batches = list(
+        polarctic_module._iter_read_request_batches(lib, read_request, n_rows=5, batch_size=4)
+    )
+    assert [batch["a"].to_list() for batch in batches] == [[3], [4, 5, 6, 7]]
+
+
+@pytest.fixture
+def segmented_lib(init_arcticdb: FixtureInfo) -> Any:
+    """Library storing 3 rows per segment, holding df1 indexed by its timestamps."""
+    lib = init_arcticdb["ac"].create_library("segmented_lib", LibraryOptions(rows_per_segment=3))
+    lib.write("df1", init_arcticdb["tables"]["df1"].set_index("ts"))
+    return lib
+
+
+def test_iter_read_request_batches_parallel_reads_segment_aligned_ranges(
+    init_arcticdb: FixtureInfo,
+    delete_arcticdb: object,
+    segmented_lib: Any,
+) -> None:
+    read_request = lf_read_request(segmented_lib, "df1")
+
+    batches = list(
+        polarctic_module._iter_read_request_batches(
+            segmented_lib, read_request, n_rows=None, batch_size=None, read_threads=2
+        )
+    )
+    assert [batch.height for batch in batches] == [6, 4]
+    assert pl.concat(batches)["a"].to_list() == list(range(10))
+
+    batches = list(
+        polarctic_module._iter_read_request_batches(
+            segmented_lib,
+            read_request._replace(row_range=(2, 8)),
+            n_rows=None,
+            batch_size=None,
+            read_threads=2,
+        )
+    )
+    assert [batch["a"].to_list() for batch in batches] == [[2, 3, 4, 5], [6, 7]]
+
+    batches = list(
+        polarctic_module._iter_read_request_batches(
+            segmented_lib,
+            read_request._replace(
+                date_range=(pd.Timestamp("2020-01-02"), pd.Timestamp("2020-01-05"))
+            ),
+            n_rows=None,
+            batch_size=None,
+            read_threads=4,
+        )
+    )
+    assert pl.concat(batches)["a"].to_list() == [1, 2, 3, 4]
+
+
+def test_scan_arcticdb_read_threads(
+    init_arcticdb: FixtureInfo,
+    delete_arcticdb: object,
+    segmented_lib: Any,
+) -> None:
+    expected = segmented_lib.read("df1", output_format=OutputFormat.POLARS).data
+
+    lf = polarctic_module.scan_arcticdb(segmented_lib, "df1", read_threads=3)
+    assert lf.collect(engine="in-memory").equals(expected)
+    assert (
+        lf.filter(pl.col("a") > 4)
+        .collect(engine="in-memory")
+        .equals(expected.filter(pl.col("a") > 4))
+    )
+
+    with pytest.raises(ValueError, match="read_threads must be at least 1"):
+        polarctic_module.scan_arcticdb(segmented_lib, "df1", read_threads=0)
+
+
+def test_scan_arcticdb_read_threads_reads_one_version(
+    init_arcticdb: FixtureInfo,
+    delete_arcticdb: object,
+    segmented_lib: Any,
+    record_reads: RecordReads,
+) -> None:
+    expected = segmented_lib.read("df1", output_format=OutputFormat.POLARS).data
+    lf = polarctic_module.scan_arcticdb(segmented_lib, "df1", read_threads=2)
+    lf.collect_schema()
+    newer = pd.DataFrame(
+        {"a": np.arange(1000, 1020), "b": np.zeros(20)},
+        index=pd.date_range("2020-01-01", periods=20, name="ts"),
+    )
+
+    def write_newer_version(call: dict[str, Any]) -> None:
+        if len(reads.calls) == 1:
+            segmented_lib.write("df1", newer)
+
+    reads = record_reads(segmented_lib, before=write_newer_version)
+    assert lf.collect(engine="in-memory").equals(expected)
+    assert {call["as_of"] for call in reads.calls} == {0}
+
+
+def test_iter_read_request_batches_aggregation_is_not_sliced(
+    init_arcticdb: FixtureInfo,
+    delete_arcticdb: object,
+    segmented_lib: Any,
+) -> None:
+    query_builder = make_query_builder().groupby("a").agg({"b": "sum"})
+    read_request = lf_read_request(segmented_lib, "df1")._replace(query_builder=query_builder)
+
+    for batch_size, read_threads in [(2, 1), (None, 2)]:
+        batches = list(
+            polarctic_module._iter_read_request_batches(
+                segmented_lib, read_request, None, batch_size, read_threads
+            )
+        )
+        assert len(batches) == 1
+        assert batches[0].height == 10
+
+
+def test_iter_read_request_batches_prefetch_matches_sequential(
+    init_arcticdb: FixtureInfo,
+    delete_arcticdb: object,
+    segmented_lib: Any,
+) -> None:
+    query_builder = make_query_builder()
+    query_builder = query_builder[query_builder["a"] > 2]
+    read_request = lf_read_request(segmented_lib, "df1")
+    requests = [
+        read_request,
+        read_request._replace(row_range=(1, 9)),
+        read_request._replace(query_builder=query_builder),
+        read_request._replace(date_range=(pd.Timestamp("2020-01-02"), pd.Timestamp("2020-01-08"))),
+    ]
+
+    for request in requests:
+        for n_rows in [None, 4]:
+            sequential = list(
+                polarctic_module._iter_read_request_batches(segmented_lib, request, n_rows, 3)
+            )
+            prefetched = list(
+                polarctic_module._iter_read_request_batches(
+                    segmented_lib, request, n_rows, 3, prefetch=2
+                )
+            )
+            assert pl.concat(prefetched).equals(pl.concat(sequential))
+
+
+def test_iter_prefetched_bounds_read_ahead() -> None:
+    consumed: list[tuple[int, int]] = []
+
+    def row_ranges() -> Iterator[tuple[int, int]]:
+        for start in range(0, 100, 10):
+            consumed.append((start, start + 10))
+            yield start, start + 10
+
+    def read(row_range: tuple[int, int]) -> pa.Table:
+        return pa.table({"start": [row_range[0]]})
+
+    tables = polarctic_module._iter_prefetched(read, row_ranges(), depth=2)
+    assert next(tables)["start"].to_pylist() == [0]
+    # The consumed batch plus at most `depth` reads issued ahead of the consumer.
+    assert len(consumed) == 3
+    tables.close()
+    assert len(consumed) == 3
+
+
+def test_scan_arcticdb_prefetch(
+    init_arcticdb: FixtureInfo,
+    delete_arcticdb: object,
+    segmented_lib: Any,
+) -> None:
+    expected = segmented_lib.read("df1", output_format=OutputFormat.POLARS).data
+
+    lf = polarctic_module.scan_arcticdb(segmented_lib, "df1", prefetch=2)
+    assert lf.collect(engine="streaming").equals(expected)
+
+    with pytest.raises(ValueError, match="prefetch must not be negative"):
+        polarctic_module.scan_arcticdb(segmented_lib, "df1", prefetch=-1)
+
+
+def test_iter_read_request_batches_segment_alignment(
+    init_arcticdb: FixtureInfo,
+    delete_arcticdb: object,
+    segmented_lib: Any,
+) -> None:
+    read_request = lf_read_request(segmented_lib, "df1")
+
+    def heights(request: Any, n_rows: int | None, batch_alignment: Any, **kwargs: Any) -> list[int]:
+        batches = polarctic_module._iter_read_request_batches(
+            segmented_lib, request, n_rows, 6, batch_alignment=batch_alignment, **kwargs
+        )
+        return [batch.height for batch in batches]
+
+    assert heights(read_request, None, "segments") == [3, 3, 3, 1]
+    assert heights(read_request, None, "coalesce") == [6, 4]
+    assert heights(read_request._replace(row_range=(2, 8)), None, "segments") == [1, 3, 2]
+    assert heights(read_request, 5, "segments") == [3, 2]
+    assert heights(read_request, 5, "segments", prefetch=2) == [3, 2]
+
+    date_range = (pd.Timestamp("2020-01-02"), pd.Timestamp("2020-01-05"))
+    assert heights(read_request._replace(date_range=date_range), None, "segments") == [2, 2]
+
+    query_builder = make_query_builder()
+    query_builder = query_builder[query_builder["a"] > 3]
+    filtered = read_request._replace(query_builder=query_builder)
+    assert heights(filtered, None, "segments") == [2, 3, 1]
+    assert heights(filtered, 4, "coalesce") == [2, 2]
+
+    alignments: list[polarctic_module.BatchAlignment] = ["segments", "coalesce"]
+    for request in [read_request, filtered, read_request._replace(date_range=date_range)]:
+        for n_rows in [None, 4]:
+            rows = list(
+                polarctic_module._iter_read_request_batches(segmented_lib, request, n_rows, 6)
+            )
+            for batch_alignment in alignments:
+                aligned = list(
+                    polarctic_module._iter_read_request_batches(
+                        segmented_lib, request, n_rows, 6, batch_alignment=batch_alignment
+                    )
+                )
+                assert pl.concat(aligned).equals(pl.concat(rows))
+
+
+def test_scan_arcticdb_batch_alignment(
+    init_arcticdb: FixtureInfo,
+    delete_arcticdb: object,
+    segmented_lib: Any,
+) -> None:
+    expected = segmented_lib.read("df1", output_format=OutputFormat.POLARS).data
+
+    alignments: list[polarctic_module.BatchAlignment] = ["segments", "coalesce"]
+    for batch_alignment in alignments:
+        lf = polarctic_module.scan_arcticdb(segmented_lib, "df1", batch_alignment=batch_alignment)
+        assert lf.collect(engine="streaming").equals(expected)
+
+    with pytest.raises(ValueError, match="Unsupported batch alignment"):
+        polarctic_module.scan_arcticdb(
+            segmented_lib,
+            "df1",
+            batch_alignment="pages",  # type: ignore[call-overload]
+        )
+
+
+def test_library_pool_reuses_handles(init_arcticdb: FixtureInfo, delete_arcticdb: object) -> None:
+    uri = init_arcticdb["uri"]
+    lib_name = init_arcticdb["lib_name"]
+    init_arcticdb["ac"].create_library("other_lib")
+    pool = polarctic_module.LibraryPool(max_arctics=1, max_libraries=1)
+
+    lib = pool.get_library(uri, lib_name)
+    assert pool.get_library(uri, lib_name) is lib
+    assert pool.get_library(uri, "other_lib") is not lib
+    # Only one handle fits: the first library was evicted.
+    assert len(pool) == 1
+    assert pool.get_library(uri, lib_name) is not lib
+
+    lib = pool.get_library(uri, lib_name)
+    pool.invalidate(uri, lib_name)
+    assert len(pool) == 0
+    assert pool.get_library(uri, lib_name) is not lib
+    pool.invalidate()
+    assert len(pool) == 0
+
+    with pytest.raises(ValueError, match="sizes must be at least 1"):
+        polarctic_module.LibraryPool(max_libraries=0)
+
+
+def test_library_pool_connects_outside_lock(
+    init_arcticdb: FixtureInfo, delete_arcticdb: object, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    uri = init_arcticdb["uri"]
+    lib_name = init_arcticdb["lib_name"]
+    pool = polarctic_module.LibraryPool()
+    lib = pool.get_library(uri, lib_name)
+    connecting = threading.Event()
+    release = threading.Event()
+    connects = []
+
+    class SlowArctic:
+        def __init__(self, uri: str) -> None:
+            connects.append(uri)
+            connecting.set()
+            release.wait(5)
+
+        def get_library(self, name: str) -> str:
+            return name
+
+    monkeypatch.setattr(polarctic_module, "Arctic", SlowArctic)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        slow = [executor.submit(pool.get_library, "slow://", "lib") for _ in range(2)]
+        assert connecting.wait(5)
+        # A pooled handle is served while another store is still connecting.
+        assert pool.get_library(uri, lib_name) is lib
+        release.set()
+        assert [future.result() for future in slow] == ["lib", "lib"]
+    # Concurrent lookups of one store share a single connection.
+    assert connects == ["slow://"]
+
+
+def test_scan_arcticdb_uri_uses_library_pool(
+    init_arcticdb: FixtureInfo, delete_arcticdb: object
+) -> None:
+    uri = init_arcticdb["uri"]
+    lib_name = init_arcticdb["lib_name"]
+
+    polarctic_module.scan_arcticdb(uri, lib_name, "df1")
+    lib = polarctic_module.library_pool.get_library(uri, lib_name)
+    polarctic_module.scan_arcticdb(uri, lib_name, "df2")
+    assert polarctic_module.library_pool.get_library(uri, lib_name) is lib
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_library_pool_is_empty_after_fork(
+    init_arcticdb: FixtureInfo, delete_arcticdb: object
+) -> None:
+    pool = polarctic_module.LibraryPool()
+    pool.get_library(init_arcticdb["uri"], init_arcticdb["lib_name"])
+
+    pid = os.fork()
+    if pid == 0:
+        os._exit(0 if len(pool) == 0 else 1)
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+    assert len(pool) == 1
+
+
+def test_schema_cache_pins_versions_and_expires_latest(
+    init_arcticdb: FixtureInfo, delete_arcticdb: object, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    lib = init_arcticdb["lib"]
+    cache = polarctic_module.SchemaCache(maxsize=2, latest_ttl=10.0)
+    loads: list[int] = []
+
+    def loader(version: int) -> pl.Schema:
+        loads.append(version)
+        return pl.Schema({"a": pl.Int64})
+
+    now = 100.0
+    monkeypatch.setattr(polarctic_module.time, "monotonic", lambda: now)
+    cache.get(lib, "df1", 0, loader)
+    cache.get(lib, "df1", None, loader)
+    cache.get(lib, "df1", 0, loader)
+    # "latest" resolved to version 0, whose schema was already cached.
+    assert loads == [0]
+
+    lib.write("df1", init_arcticdb["tables"]["df1"].head(3))
+    cache.get(lib, "df1", None, loader)
+    assert loads == [0]
+    now = 111.0
+    cache.get(lib, "df1", None, loader)
+    cache.get(lib, "df1", 0, loader)
+    assert loads == [0, 1]
+
+    cache.get(lib, "df2", None, loader)
+    assert len(cache) == 2
+    cache.invalidate(lib, "df2")
+    assert len(cache) == 1
+    cache.invalidate()
+    assert len(cache) == 0
+
+    with pytest.raises(ValueError, match="latest_ttl must not be negative"):
+        polarctic_module.SchemaCache(latest_ttl=-1)
+
+
+def test_scan_arcticdb_sees_schema_of_rewritten_symbol(
+    init_arcticdb: FixtureInfo, delete_arcticdb: object, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    lib = init_arcticdb["lib"]
+    monkeypatch.setattr(polarctic_module, "schema_cache", polarctic_module.SchemaCache())
+    lib.write("rewritten", pd.DataFrame({"a": [1, 2]}))
+    assert polarctic_module.scan_arcticdb(lib, "rewritten").collect_schema().names() == ["a"]
+
+    lib.write("rewritten", pd.DataFrame({"a": [1.5], "c": ["x"]}))
+    lf = polarctic_module.scan_arcticdb(lib, "rewritten")
+    assert lf.collect().to_dict(as_series=False) == {"a": [1.5], "c": ["x"]}
+    assert lf.select("c").collect()["c"].to_list() == ["x"]
+
+
+def test_scan_arcticdb_shares_schema_across_scans(
+    init_arcticdb: FixtureInfo, delete_arcticdb: object, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    lib = init_arcticdb["lib"]
+    monkeypatch.setattr(polarctic_module, "schema_cache", polarctic_module.SchemaCache())
+    calls: list[Any] = []
+    collect_schema = LazyDataFrame._collect_schema
+
+    def spy(self: LazyDataFrame) -> pl.Schema:
+        calls.append(self)
+        return cast(pl.Schema, collect_schema(self))
+
+    monkeypatch.setattr(LazyDataFrame, "_collect_schema", spy)
+
+    for _ in range(3):
+        schema = polarctic_module.scan_arcticdb(lib, "df1", as_of=0).collect_schema()
+    assert len(calls) == 1
+    assert schema.names() == ["a", "b", "ts"]
+
+
+def test_scan_arcticdb_pin_version(init_arcticdb: FixtureInfo, delete_arcticdb: object) -> None:
+    lib = init_arcticdb["lib"]
+    uri = init_arcticdb["uri"]
+    lib_name = init_arcticdb["lib_name"]
+    expected = init_arcticdb["tables"]["df1"]
+
+    pinned = polarctic_module.scan_arcticdb(lib, "df1", pin_version=True)
+    pinned_uri = polarctic_module.scan_arcticdb(uri, lib_name, "df1", pin_version=True)
+    latest = polarctic_module.scan_arcticdb(lib, "df1")
+    lib.write("df1", expected.head(3))
+
+    assert pinned.collect().height == 10
+    assert pinned_uri.collect().height == 10
+    assert latest.collect().height == 3
+    assert polarctic_module._resolve_version(lib, "df1", None) == 1
+    assert polarctic_module._resolve_version(lib, "df1", -2) == 0
+
+
+def test_result_cache_key_is_canonical(init_arcticdb: FixtureInfo, delete_arcticdb: object) -> None:
+    lib = init_arcticdb["lib"]
+    read_request = lf_read_request(lib, "df1")._replace(as_of=0)
+
+    def filtered(values: list[int]) -> Any:
+        query_builder = make_query_builder()
+        return read_request._replace(query_builder=query_builder[query_builder["a"].isin(values)])
+
+    key = polarctic_module._result_cache_key
+    assert key(lib, filtered([1, 2])) == key(lib, filtered([1, 2]))
+    assert key(lib, filtered([1, 2])) != key(lib, filtered([1, 3]))
+    assert key(lib, read_request) != key(lib, read_request._replace(row_range=(0, 5)))
+    assert key(lib, read_request) != key(lib, read_request._replace(as_of=1))
+    assert key(lib, read_request._replace(as_of=None)) is None
+
+
+def test_disk_result_cache_serves_pinned_reads(
+    init_arcticdb: FixtureInfo,
+    delete_arcticdb: object,
+    tmp_path: Any,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    lib = init_arcticdb["lib"]
+    cache = polarctic_module.DiskResultCache(tmp_path / "results")
+    expected = lib.read("df1", output_format=OutputFormat.POLARS).data
+
+    lf = polarctic_module.scan_arcticdb(lib, "df1", pin_version=True, result_cache=cache)
+    assert lf.collect(engine="in-memory").equals(expected)
+    assert len(cache) == 1
+
+    def fail_read(*args: Any, **kwargs: Any) -> Any:
+        raise AssertionError("read should be served from the cache")
+
+    monkeypatch.setattr(lib, "read", fail_read)
+    assert lf.collect(engine="in-memory").equals(expected)
+    # A new cache over the same directory picks up the stored entries.
+    reopened = polarctic_module.DiskResultCache(tmp_path / "results")
+    assert len(reopened) == 1
+    assert reopened.total_bytes == cache.total_bytes
+
+
+def test_disk_result_cache_evicts_least_recently_used(tmp_path: Any) -> None:
+    table = pa.table({"a": list(range(1000))})
+    cache = polarctic_module.DiskResultCache(tmp_path)
+    cache.put("first", table)
+    entry_bytes = cache.total_bytes
+
+    cache = polarctic_module.DiskResultCache(tmp_path, max_bytes=2 * entry_bytes)
+    cache.put("second", table)
+    assert cache.get("first") is not None
+    cache.put("third", table)
+    assert cache.get("second") is None
+    assert cache.get("first") is not None
+    assert cache.get("third") == table
+    assert cache.total_bytes == 2 * entry_bytes
+
+    # Larger than the whole cache: not stored.
+    polarctic_module.DiskResultCache(tmp_path, max_bytes=1).put("big", table)
+    assert not (tmp_path / "big.arrow").exists()
+
+    cache.clear()
+    assert len(cache) == 0
+    assert not list(tmp_path.glob("*.arrow"))
+
+
+def test_memory_result_cache_counts_hits_and_evicts_by_bytes(
+    init_arcticdb: FixtureInfo, delete_arcticdb: object
+) -> None:
+    lib = init_arcticdb["lib"]
+    cache = polarctic_module.MemoryResultCache()
+    expected = lib.read("df1", output_format=OutputFormat.POLARS).data
+
+    lf = polarctic_module.scan_arcticdb(lib, "df1", pin_version=True, result_cache=cache)
+    for _ in range(3):
+        assert lf.collect(engine="in-memory").equals(expected)
+    assert (cache.hits, cache.misses) == (2, 1)
+
+    # Unpinned reads bypass the cache.
+    polarctic_module.scan_arcticdb(lib, "df1", result_cache=cache).collect()
+    assert (cache.hits, cache.misses, len(cache)) == (2, 1, 1)
+
+    table = pa.table({"a": list(range(100))})
+    entry_bytes = table.get_total_buffer_size()
+    cache = polarctic_module.MemoryResultCache(max_bytes=2 * entry_bytes)
+    cache.put("first", table)
+    cache.put("second", table)
+    assert cache.get("first") is table
+    cache.put("third", table)
+    assert cache.get("second") is None
+    assert cache.total_bytes == 2 * entry_bytes
+    cache.put("big", pa.concat_tables([table] * 3).combine_chunks())
+    assert cache.get("big") is None
+    cache.clear()
+    assert (len(cache), cache.total_bytes, cache.hits, cache.misses) == (0, 0, 0, 0)
+
+
+def test_result_cache_requires_get_and_put() -> None:
+    class GetOnlyCache(polarctic_module.ResultCache):
+        def get(self, key: str) -> pa.Table | None:
+            return None
+
+    with pytest.raises(TypeError, match="abstract"):
+        GetOnlyCache()  # type: ignore[abstract]
+
+
+def test_scan_arcticdb_group_by_pushdown(
+    init_arcticdb: FixtureInfo, delete_arcticdb: object, record_reads: RecordReads
+) -> None:
+    lib = init_arcticdb["lib"]
+    df = pd.DataFrame(
+        {"label": list("abcab"), "b": [1, 2, 3, 4, 5], "c": [1.0, 2.0, 3.0, 4.0, 6.0]}
+    )
+    lib.write("labelled", df)
+    aggs = [pl.col("b").sum().alias("total"), pl.col("c").mean(), pl.col("b").max().alias("top")]
+    expected = pl.from_pandas(df).group_by("label").agg(aggs).sort("label")
+
+    lf = polarctic_module.scan_arcticdb(lib, "labelled", group_by="label", agg=aggs)
+    reads = record_reads(lib)
+    result = lf.collect().sort("label")
+    assert result.columns == ["label", "total", "c", "top"]
+    assert result.equals(expected)
+    assert reads.results[-1].data.num_rows == 3
+
+    filtered = lf.filter(pl.col("total") > 5).select("label", "top").collect()
+    assert filtered.to_dict(as_series=False) == {"label": ["b"], "top": [5]}
+
+    with pytest.raises(
+        ValueError, match="agg must be given with exactly one of group_by or resample"
+    ):
+        polarctic_module.scan_arcticdb(lib, "labelled", group_by="label")
+    with pytest.raises(ValueError, match="Cannot push down aggregation"):
+        polarctic_module.scan_arcticdb(lib, "labelled", group_by="label", agg=[pl.col("b").std()])
+    for first_or_last in (pl.col("b").first(), pl.col("c").last().alias("latest")):
+        with pytest.raises(ValueError, match="requires resample"):
+            polarctic_module.scan_arcticdb(lib, "labelled", group_by="label", agg=[first_or_last])
+
+    lazy_df = lib.read("labelled", lazy=True, output_format=OutputFormat.PYARROW)
+    for options in (
+        {"group_by": "label", "agg": aggs},
+        {"resample": "1m", "agg": aggs},
+        {"computed": [(pl.col("b") * 2).alias("double")]},
+    ):
+        with pytest.raises(ValueError, match="cannot be used with a LazyDataFrame"):
+            polarctic_module.scan_arcticdb(lazy_df, **options)
+
+
+def test_scan_arcticdb_resample_pushdown(
+    init_arcticdb: FixtureInfo, delete_arcticdb: object
+) -> None:
+    lib = init_arcticdb["lib"]
+    ticks = pd.DataFrame(
+        {"price": np.arange(100, dtype=np.float64), "size": np.arange(100, dtype=np.int64)},
+        index=pd.date_range("2020-01-01 00:00:10", periods=100, freq="7s", name="ts"),
+    )
+    lib.write("ticks", ticks)
+    aggs = [
+        pl.col("price").first().alias("open"),
+        pl.col("price").max().alias("high"),
+        pl.col("price").last().alias("close"),
+        pl.col("size").sum(),
+    ]
+    expected = pl.from_pandas(ticks.reset_index()).group_by_dynamic("ts", every="1m").agg(aggs)
+
+    lf = polarctic_module.scan_arcticdb(lib, "ticks", resample="1m", agg=aggs)
+    assert lf.collect().equals(expected)
+    assert lf.filter(pl.col("size") > 400).collect().equals(expected.filter(pl.col("size") > 400))
+
+    with pytest.raises(ValueError, match="requires a datetime-indexed symbol"):
+        polarctic_module.scan_arcticdb(lib, "df1", resample="1m", agg=aggs)
+    with pytest.raises(ValueError, match="exactly one of group_by or resample"):
+        polarctic_module.scan_arcticdb(lib, "ticks", group_by="size", resample="1m", agg=aggs)
+
+    # ArcticDB's first and last skip NaN, where Polars' would return null.
+    gappy = pd.DataFrame(
+        {"price": [np.nan, 1.0, 2.0, np.nan]},
+        index=pd.date_range("2020-01-01", periods=4, freq="30s", name="ts"),
+    )
+    lib.write("gappy", gappy)
+    edges = [pl.col("price").first().alias("open"), pl.col("price").last().alias("close")]
+    result = polarctic_module.scan_arcticdb(lib, "gappy", resample="1m", agg=edges).collect()
+    assert result.select("open", "close").to_dict(as_series=False) == {
+        "open": [1.0, 2.0],
+        "close": [1.0, 2.0],
+    }
+
+
+@pytest.mark.parametrize("translation_engine", ["string", "tree"])
+def test_scan_arcticdb_computed_columns(
+    init_arcticdb: FixtureInfo,
+    delete_arcticdb: object,
+    record_reads: RecordReads,
+    translation_engine: polarctic_module.TranslationEngine,
+) -> None:
+    lib = init_arcticdb["lib"]
+    df1 = pl.from_pandas(init_arcticdb["tables"]["df1"])
+    computed = [(pl.col("a") * pl.col("b")).alias("notional"), (pl.col("a") + 1).alias("next")]
+
+    reads = record_reads(lib)
+    lf = polarctic_module.scan_arcticdb(
+        lib, "df1", computed=computed, translation_engine=translation_engine
+    )
+    assert lf.collect_schema().names() == ["a", "b", "ts", "notional", "next"]
+
+    result = lf.select("notional").collect()
+    assert result.equals(df1.select(computed[0]))
+    # Only the derived column was returned by ArcticDB.
+    assert reads.results[-1].data.column_names == ["notional"]
+
+    result = lf.filter(pl.col("notional") > 100).select("a", "next").collect()
+    assert result.equals(df1.filter(pl.col("a") * pl.col("b") > 100).select("a", computed[1]))
+
+    with pytest.raises(ValueError, match="Cannot push down computed column"):
+        polarctic_module.scan_arcticdb(lib, "df1", computed=[pl.col("a").cum_sum().alias("c")])
+    for clashing in (
+        [(pl.col("a") * 2).alias("a")],
+        [pl.col("b") * 2],
+        [(pl.col("a") + 1).alias("ts")],
+        [(pl.col("a") + 1).alias("c"), (pl.col("a") + 2).alias("c")],
+    ):
+        with pytest.raises(ValueError, match="clashes with an existing column"):
+            polarctic_module.scan_arcticdb(lib, "df1", computed=clashing)
+
+
+def test_scan_arcticdb_aggregates_computed_columns(
+    init_arcticdb: FixtureInfo, delete_arcticdb: object
+) -> None:
+    lib = init_arcticdb["lib"]
+    lib.write(
+        "labelled", pd.DataFrame({"label": list("abab"), "a": [1, 2, 3, 4], "b": [2, 2, 2, 2]})
+    )
+
+    lf = polarctic_module.scan_arcticdb(
+        lib,
+        "labelled",
+        computed=[(pl.col("a") * pl.col("b")).alias("notional")],
+        group_by="label",
+        agg=[pl.col("notional").sum()],
+    )
+    assert lf.sort("label").collect().to_dict(as_series=False) == {
+        "label": ["a", "b"],
+        "notional": [8, 12],
+    }
+
+
+def test_count_arcticdb_from_metadata(
+    init_arcticdb: FixtureInfo,
+    delete_arcticdb: object,
+    segmented_lib: Any,
+    record_reads: RecordReads,
+) -> None:
+    uri = init_arcticdb["uri"]
+    lib_name = init_arcticdb["lib_name"]
+    assert polarctic_module.count_arcticdb(uri, lib_name, "df1") == 10
+
+    reads = record_reads(segmented_lib)
+    assert polarctic_module.count_arcticdb(segmented_lib, "df1") == 10
+    assert reads.calls == []
+
+    # Segments hold 3 days each: only the segments straddling a bound are read.
+    date_range = (pd.Timestamp("2020-01-02"), pd.Timestamp("2020-01-08"))
+    assert polarctic_module.count_arcticdb(segmented_lib, "df1", date_range=date_range) == 7
+    assert [call["row_range"] for call in reads.calls] == [(0, 3), (6, 9)]
+    assert all(call["columns"] == [] for call in reads.calls)
+
+    for date_range, expected in [
+        ((pd.Timestamp("2020-01-04"), pd.Timestamp("2020-01-06")), 3),
+        ((None, pd.Timestamp("2020-01-05 12:00")), 5),
+        ((pd.Timestamp("2020-01-10"), None), 1),
+        ((pd.Timestamp("2021-01-01"), None), 0),
+    ]:
+        count = polarctic_module.count_arcticdb(segmented_lib, "df1", date_range=date_range)
+        assert count == expected
+
+    with pytest.raises(ValueError, match="requires a datetime-indexed symbol"):
+        polarctic_module.count_arcticdb(
+            init_arcticdb["lib"], "df1", date_range=(None, pd.Timestamp("2020"))
+        )
+
+    # A tz-aware index is compared in UTC, also within the segments straddling a bound.
+    df1 = segmented_lib.read("df1").data
+    segmented_lib.write("df1_utc", df1.tz_localize("UTC"))
+    date_range = (pd.Timestamp("2020-01-02", tz="UTC"), pd.Timestamp("2020-01-08 01:00"))
+    assert polarctic_module.count_arcticdb(segmented_lib, "df1_utc", date_range=date_range) == 7
+    segmented_lib.write("empty", df1.head(0))
+    assert polarctic_module.count_arcticdb(segmented_lib, "empty", date_range=date_range) == 0
+    with pytest.raises(TypeError, match="Unsupported source type"):
+        polarctic_module.count_arcticdb(42, "df1")  # type: ignore[call-overload]
+
+
+def test_index_range_arcticdb_from_metadata(
+    init_arcticdb: FixtureInfo,
+    delete_arcticdb: object,
+    segmented_lib: Any,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    expected = segmented_lib.read("df1").data.index
+    monkeypatch.setattr(segmented_lib, "read", None)
+    assert polarctic_module.index_range_arcticdb(segmented_lib, "df1") == (
+        expected.min(),
+        expected.max(),
+    )
+
+    segmented_lib.write("empty", pd.DataFrame({"a": []}, index=pd.DatetimeIndex([], name="ts")))
+    assert polarctic_module.index_range_arcticdb(segmented_lib, "empty") == (None, None)
+
+    with pytest.raises(ValueError, match="requires a datetime-indexed symbol"):
+        polarctic_module.index_range_arcticdb(init_arcticdb["lib"], "df1")
+
+
+def test_iter_read_request_batches_limit_after_filter_reads_growing_runs(
+    init_arcticdb: FixtureInfo,
+    delete_arcticdb: object,
+    segmented_lib: Any,
+    record_reads: RecordReads,
+) -> None:
+    query_builder = make_query_builder()
+    query_builder = query_builder[query_builder["a"].isin([1, 3, 5, 7, 9])]
+    read_request = lf_read_request(segmented_lib, "df1")._replace(query_builder=query_builder)
+
+    reads = record_reads(segmented_lib)
+
+    def row_ranges() -> list[Any]:
+        return [call.get("row_range") for call in reads.calls]
+
+    def head(request: Any, n_rows: int) -> list[int]:
+        reads.clear()
+        batches = polarctic_module._iter_read_request_batches(segmented_lib, request, n_rows, None)
+        return cast(list[int], pl.concat(batches)["a"].to_list())
+
+    # One segment, then two: the last segment is never read.
+    assert head(read_request, 3) == [1, 3, 5]
+    assert row_ranges() == [(0, 3), (3, 9)]
+    assert head(read_request, 1) == [1]
+    assert row_ranges() == [(0, 3)]
+    assert head(read_request, 100) == [1, 3, 5, 7, 9]
+
+    date_range = (pd.Timestamp("2020-01-05"), pd.Timestamp("2020-01-09"))
+    assert head(read_request._replace(date_range=date_range), 2) == [5, 7]
+    assert head(read_request._replace(row_range=(4, 10)), 2) == [5, 7]
+    assert row_ranges() == [(4, 6), (6, 10)]
+
+
+def test_iter_read_request_batches_limit_reads_one_version(
+    init_arcticdb: FixtureInfo,
+    delete_arcticdb: object,
+    segmented_lib: Any,
+    record_reads: RecordReads,
+) -> None:
+    query_builder = make_query_builder()
+    query_builder = query_builder[query_builder["a"].isin([1, 3, 5, 7, 9])]
+    read_request = lf_read_request(segmented_lib, "df1")._replace(query_builder=query_builder)
+    newer = pd.DataFrame(
+        {"a": np.arange(1000, 1020), "b": np.zeros(20)},
+        index=pd.date_range("2020-01-01", periods=20, name="ts"),
+    )
+
+    def write_newer_version(call: dict[str, Any]) -> None:
+        if len(reads.calls) == 1:
+            segmented_lib.write("df1", newer)
+
+    reads = record_reads(segmented_lib, before=write_newer_version)
+    batches = polarctic_module._iter_read_request_batches(segmented_lib, read_request, 3, None)
+    assert pl.concat(batches)["a"].to_list() == [1, 3, 5]
+    assert [call["as_of"] for call in reads.calls] == [0, 0]
+
+
+def test_scan_arcticdb_tail(
+    init_arcticdb: FixtureInfo,
+    delete_arcticdb: object,
+    segmented_lib: Any,
+    record_reads: RecordReads,
+) -> None:
+    expected = segmented_lib.read("df1", output_format=OutputFormat.POLARS).data
+
+    lf = polarctic_module.scan_arcticdb(segmented_lib, "df1", tail=4)
+    reads = record_reads(segmented_lib)
+    assert lf.collect(engine="in-memory").equals(expected.tail(4))
+    assert [call["row_range"] for call in reads.calls] == [(6, 10)]
+    assert lf.collect(engine="streaming").equals(expected.tail(4))
+    assert lf.head(2).collect().equals(expected.tail(4).head(2))
+    assert lf.filter(pl.col("a") > 7).collect().equals(expected.filter(pl.col("a") > 7))
+    assert lf.collect(engine="in-memory").equals(
+        polarctic_module.scan_arcticdb(
+            segmented_lib, "df1", tail=4, read_threads=2, batch_alignment="segments"
+        ).collect(engine="in-memory")
+    )
+
+    assert polarctic_module.scan_arcticdb(segmented_lib, "df1", tail=0).collect().height == 0
+    assert polarctic_module.scan_arcticdb(segmented_lib, "df1", tail=50).collect().equals(expected)
+
+    lazy_df = segmented_lib.read("df1", lazy=True, output_format=OutputFormat.PYARROW)
+    lf = polarctic_module.scan_arcticdb(lazy_df, tail=4)
+    assert lf.collect().equals(expected.tail(4))
+    assert polarctic_module.scan_arcticdb(lazy_df, tail=0).collect().height == 0
+    lazy_df = lazy_df[lazy_df["a"] != 8]
+    assert polarctic_module.scan_arcticdb(lazy_df, tail=4).collect()["a"].to_list() == [6, 7, 9]
+    with pytest.raises(ValueError, match="tail must not be negative"):
+        polarctic_module.scan_arcticdb(segmented_lib, "df1", tail=-1)
+
+
+def test_scan_arcticdb_row_range_and_date_range(
+    init_arcticdb: FixtureInfo, delete_arcticdb: object, segmented_lib: Any
+) -> None:
+    uri = init_arcticdb["uri"]
+    lib_name = init_arcticdb["lib_name"]
+    expected = segmented_lib.read("df1", output_format=OutputFormat.POLARS).data
+    date_range = (dt.datetime(2020, 1, 3), dt.datetime(2020, 1, 7))
+    in_dates = pl.col("ts").is_between(*date_range)
+
+    lf = polarctic_module.scan_arcticdb(segmented_lib, "df1", row_range=(2, 7))
+    assert lf.collect().equals(expected.slice(2, 5))
+    assert lf.filter(pl.col("a") > 4).collect().equals(expected.slice(5, 2))
+
+    lf = polarctic_module.scan_arcticdb(segmented_lib, "df1", date_range=date_range)
+    assert lf.collect().equals(expected.filter(in_dates))
+    assert lf.collect(engine="streaming").equals(expected.filter(in_dates))
+    # Index predicates narrow the date_range further.
+    narrowed = lf.filter(pl.col("ts") <= dt.datetime(2020, 1, 5)).collect()
+    assert narrowed["a"].to_list() == [2, 3, 4]
+
+    # A tz-aware date_range combines with naive index predicates as UTC.
+    lf = polarctic_module.scan_arcticdb(
+        segmented_lib, "df1", date_range=(pd.Timestamp("2020-01-03", tz="UTC"), None)
+    )
+    narrowed = lf.filter(pl.col("ts") >= dt.datetime(2020, 1, 4, 3)).collect()
+    assert narrowed["a"].to_list() == [4, 5, 6, 7, 8, 9]
+    lazy_df = segmented_lib.read("df1", lazy=True, output_format=OutputFormat.PYARROW)
+    lazy_df = lazy_df.date_range((pd.Timestamp("2020-01-03", tz="UTC"), None))
+    lf = polarctic_module.scan_arcticdb(lazy_df, date_range=(None, dt.datetime(2020, 1, 5)))
+    assert lf.collect()["a"].to_list() == [2, 3, 4]
+
+    lf = polarctic_module.scan_arcticdb(uri, lib_name, "df2", row_range=(-3, None))
+    assert lf.collect().height == 3
+
+    lazy_df = segmented_lib.read("df1", lazy=True, output_format=OutputFormat.PYARROW)
+    lazy_df = lazy_df[lazy_df["a"] != 3]
+    lf = polarctic_module.scan_arcticdb(lazy_df, date_range=date_range)
+    assert lf.collect()["a"].to_list() == [2, 4, 5, 6]
+    lf = polarctic_module.scan_arcticdb(lazy_df, row_range=(0, 5))
+    assert lf.collect()["a"].to_list() == [0, 1, 2, 4]
+    # The LazyDataFrame itself is left untouched.
+    assert lazy_df._to_read_request().row_range is None
+
+    with pytest.raises(ValueError, match="Only one of row_range, date_range and tail"):
+        polarctic_module.scan_arcticdb(segmented_lib, "df1", row_range=(0, 1), tail=1)
+
+
+def test_scan_arcticdb_many_uses_read_batch(
+    init_arcticdb: FixtureInfo,
+    delete_arcticdb: object,
+    segmented_lib: Any,
+    record_reads: RecordReads,
+) -> None:
+    df1 = segmented_lib.read("df1").data
+    segmented_lib.write("df3", df1.assign(a=df1["a"] + 100))
+    segmented_lib.write("df4", df1.assign(a=df1["a"] + 200))
+    symbols = ["df1", "df3", "df4"]
+    expected = pl.concat(
+        polarctic_module.scan_arcticdb(segmented_lib, symbol).with_columns(
+            pl.lit(symbol).alias("symbol")
+        )
+        for symbol in symbols
+    ).collect()
+
+    batches = record_reads(segmented_lib, method="read_batch").calls
+    lf = polarctic_module.scan_arcticdb_many(segmented_lib, symbols, symbol_column="symbol")
+    assert lf.collect_schema() == expected.schema
+    assert lf.collect().equals(expected)
+    assert len(batches) == 1
+
+    predicate = (pl.col("a") % 10 > 6) & (pl.col("symbol") != "df3")
+    result = lf.filter(predicate).select("symbol", "a").collect()
+    assert result.equals(expected.filter(predicate).select("symbol", "a"))
+    assert [request.columns for request in batches[-1]["symbols"]] == [["a"]] * 3
+
+    result = lf.filter(pl.col("ts") >= dt.datetime(2020, 1, 9)).collect()
+    assert result["a"].to_list() == [8, 9, 108, 109, 208, 209]
+    assert batches[-1]["symbols"][0].date_range == (pd.Timestamp("2020-01-09"), None)
+    assert lf.head(12).collect().equals(expected.head(12))
+    assert lf.select("symbol").collect()["symbol"].to_list() == expected["symbol"].to_list()
+
+    uri_lf = polarctic_module.scan_arcticdb_many(
+        init_arcticdb["uri"], "segmented_lib", ["df1", "df3"], as_of={"df1": 0, "df3": 0}
+    )
+    assert uri_lf.collect().height == 20
+
+    with pytest.raises(ValueError, match="symbols must not be empty"):
+        polarctic_module.scan_arcticdb_many(segmented_lib, [])
+    with pytest.raises(RuntimeError, match="Failed to read symbol missing"):
+        polarctic_module.scan_arcticdb_many(segmented_lib, ["df1", "missing"]).collect()
+
+
+def test_scan_arcticdb_coalesces_concurrent_scans(
+    delete_arcticdb: object,
+    segmented_lib: Any,
+    record_reads: RecordReads,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(polarctic_module, "_read_coalescer", polarctic_module._ReadCoalescer())
+
+    def queries(lf: pl.LazyFrame) -> list[pl.LazyFrame]:
+        return [
+            lf.filter(pl.col("a") == 4).select("a"),
+            lf.filter(pl.col("a") > 6).select("b"),
+            # The second conjunct cannot be pushed down and is applied by Polars.
+            lf.filter((pl.col("a") < 2) & (pl.col("b").cast(pl.String) != "10.0")).select("a"),
+        ]
+
+    expected = pl.collect_all(queries(polarctic_module.scan_arcticdb(segmented_lib, "df1")))
+
+    reads = record_reads(segmented_lib)
+    lf = polarctic_module.scan_arcticdb(segmented_lib, "df1", coalesce_window=0.2)
+    lf.collect_schema()
+    reads.clear()
+    results = pl.collect_all(queries(lf))
+    assert [result.equals(other) for result, other in zip(results, expected, strict=True)] == [
+        True
+    ] * 3
+    assert len(reads.calls) == 1
+    assert reads.calls[0]["columns"] == ["a", "b"]
+    assert reads.results[0].data.column("a").to_pylist() == [0, 1, 4, 7, 8, 9]
+
+    # A scan that does not push a predicate reads every row.
+    reads.clear()
+    results = pl.collect_all([lf.select("a"), lf.filter(pl.col("a") > 6).select("a")])
+    assert [result.height for result in results] == [10, 3]
+    assert len(reads.calls) == 1
+    assert reads.calls[0]["query_builder"] is None
+
+    # Index predicates narrow the shared read to the hull of their date ranges.
+    reads.clear()
+    results = pl.collect_all(
+        [
+            lf.filter(pl.col("ts") <= dt.datetime(2020, 1, 2)).select("a"),
+            lf.filter(pl.col("ts").is_between(dt.datetime(2020, 1, 4), dt.datetime(2020, 1, 5))),
+        ]
+    )
+    assert [result["a"].to_list() for result in results] == [[0, 1], [3, 4]]
+    assert len(reads.calls) == 1
+    assert reads.calls[0]["date_range"][0] is None
+    assert reads.results[0].data.column("a").to_pylist() == [0, 1, 2, 3, 4]
+
+    # The last group had company, so a lone scan waits the window; the next one does not.
+    sleeps: list[float] = []
+    sleep = time.sleep
+
+    def record_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        sleep(seconds)
+
+    monkeypatch.setattr(polarctic_module.time, "sleep", record_sleep)
+    assert lf.collect().height == 10
+    assert sleeps == [0.2]
+    assert lf.collect().height == 10
+    assert sleeps == [0.2]
+
+    with pytest.raises(ValueError, match="coalesce_window must not be negative"):
+        polarctic_module.scan_arcticdb(segmented_lib, "df1", coalesce_window=-1)
+    for options in (
+        {"read_threads": 2},
+        {"prefetch": 1},
+        {"batch_alignment": "segments"},
+    ):
+        with pytest.raises(ValueError, match="coalesce_window cannot be combined"):
+            polarctic_module.scan_arcticdb(segmented_lib, "df1", coalesce_window=0.01, **options)
+
+
+def test_concurrent_identical_reads_share_one_read(
+    delete_arcticdb: object,
+    segmented_lib: Any,
+    record_reads: RecordReads,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    lf = polarctic_module.scan_arcticdb(segmented_lib, "df1").filter(pl.col("a") > 2).select("b")
+    expected = lf.collect()
+
+    reads = record_reads(segmented_lib, delay=0.2)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda _: lf.collect(), range(4)))
+    assert all(result.equals(expected) for result in results)
+    assert len(reads.calls) == 1
+    assert len(polarctic_module._single_flight) == 0
+
+    def failing_read(*args: Any, **kwargs: Any) -> Any:
+        time.sleep(0.2)
+        raise RuntimeError("storage unavailable")
+
+    monkeypatch.setattr(segmented_lib, "read", failing_read)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(lf.collect) for _ in range(2)]
+        for future in futures:
+            with pytest.raises(RuntimeError, match="storage unavailable"):
+                future.result()
+    assert len(polarctic_module._single_flight) == 0
+
+
+def test_collect_arcticdb_async(
+    delete_arcticdb: object,
+    segmented_lib: Any,
+    record_reads: RecordReads,
+) -> None:
+    lf = polarctic_module.scan_arcticdb(segmented_lib, "df1")
+    frames = [lf.filter(pl.col("a") == value) for value in range(3)]
+    expected = [frame.collect() for frame in frames]
+
+    reads = record_reads(segmented_lib, delay=0.1)
+    collector = polarctic_module.AsyncCollector(max_workers=2)
+
+    async def gather() -> list[pl.DataFrame]:
+        return list(
+            await asyncio.gather(
+                *(polarctic_module.collect_arcticdb_async(f, collector=collector) for f in frames)
+            )
+        )
+
+    results = asyncio.run(gather())
+    assert all(result.equals(other) for result, other in zip(results, expected, strict=True))
+    assert len(reads.calls) == 3
+
+    async def cancel_pending() -> None:
+        # With one worker, the second collection waits for the first one to finish.
+        single = polarctic_module.AsyncCollector(max_workers=1)
+        running = asyncio.ensure_future(single.collect(frames[0]))
+        pending = asyncio.ensure_future(single.collect(frames[1]))
+        await asyncio.sleep(0.05)
+        pending.cancel()
+        assert (await running).equals(expected[0])
+        with pytest.raises(asyncio.CancelledError):
+            await pending
+        single.shutdown()
+
+    reads.clear()
+    asyncio.run(cancel_pending())
+    assert len(reads.calls) == 1
+    collector.shutdown()
+
+    with pytest.raises(ValueError, match="max_workers must be at least 1"):
+        polarctic_module.AsyncCollector(max_workers=0)
+
+
+def test_shard_pools_replace_broken_pool() -> None:
+    shard_pools = polarctic_module._ShardPools()
+    pool = shard_pools.get(1)
+    with pytest.raises(BrokenProcessPool):
+        pool.submit(os._exit, 1).result()
+
+    replacement = shard_pools.get(1)
+    assert replacement is not pool
+    assert replacement.submit(abs, -1).result() == 1
+    assert shard_pools.get(1) is replacement
+    replacement.shutdown()
+
+
+def test_scan_arcticdb_read_processes(
+    init_arcticdb: FixtureInfo,
+    delete_arcticdb: object,
+    segmented_lib: Any,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Any,
+) -> None:
+    shard_directory = tmp_path / "shards"
+    shard_directory.mkdir()
+    monkeypatch.setattr(polarctic_module, "_shard_directory", lambda: str(shard_directory))
+    expected = polarctic_module.scan_arcticdb(segmented_lib, "df1").collect()
+
+    lf = polarctic_module.scan_arcticdb(
+        init_arcticdb["uri"], "segmented_lib", "df1", read_processes=2
+    )
+    assert lf.collect(engine="in-memory").equals(expected)
+    assert 2 in polarctic_module._shard_pools._pools
+    predicate = pl.col("a") % 2 == 1
+    assert (
+        lf.filter(predicate)
+        .select("b")
+        .collect(engine="in-memory")
+        .equals(expected.filter(predicate).select("b"))
+    )
+    assert list(shard_directory.iterdir()) == []
+
+    segmented_lib.write("df3", segmented_lib.read("df1").data.assign(a=lambda df: df["a"] + 100))
+    many = polarctic_module.scan_arcticdb_many(
+        init_arcticdb["uri"], "segmented_lib", ["df1", "df3"], read_processes=2
+    )
+    assert many.collect(engine="in-memory")["a"].to_list() == [*range(10), *range(100, 110)]
+    with pytest.raises(RuntimeError, match="Failed to read symbol missing"):
+        polarctic_module.scan_arcticdb_many(
+            init_arcticdb["uri"], "segmented_lib", ["df1", "missing"], read_processes=2
+        ).collect()
+    assert list(shard_directory.iterdir()) == []
+
+    with pytest.raises(ValueError, match="read_processes requires the URI form"):
+        polarctic_module.scan_arcticdb(segmented_lib, "df1", read_processes=2)
+
+
+def test_uri_scan_pickles_as_scan_spec(
+    init_arcticdb: FixtureInfo,
+    delete_arcticdb: object,
+    segmented_lib: Any,
+) -> None:
+    uri = init_arcticdb["uri"]
+    lf = polarctic_module.scan_arcticdb(uri, "segmented_lib", "df1").filter(pl.col("a") > 6)
+    expected = lf.collect()
+    payload = pickle.dumps(lf.select("b"))
+
+    # The version is pinned when pickling, so later writes are not seen.
+    # Written through the pooled handle, as LMDB must only be opened once per process.
+    polarctic_module.library_pool.get_library(uri, "segmented_lib").append(
+        "df1",
+        pd.DataFrame({"a": [10], "b": [20.0]}, index=pd.DatetimeIndex(["2020-01-11"], name="ts")),
+    )
+    assert pickle.loads(payload).collect().equals(expected.select("b"))
+    assert lf.collect().height == 4
+
+    with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("spawn")) as executor:
+        shipped = executor.submit(pl.LazyFrame.collect, pickle.loads(payload)).result()
+    assert shipped.equals(expected.select("b"))
+
+    spec = polarctic_module.ScanSpec(
+        uri, "segmented_lib", ReadRequest("df1", as_of=0, columns=["a"]), read_threads=2
+    )
+    result = spec.scan().filter(pl.col("a") < 2).collect()
+    assert result.columns == ["ts", "a"]
+    assert result["a"].to_list() == [0, 1]
+    assert pickle.loads(pickle.dumps(spec.scan())).collect().height == 10